@@ -372,7 +372,21 @@ def extract_reconciliate_write(biocypher_config_path, schema_path, data_to_mappi
     return weave(biocypher_config_path, schema_path, data_to_mapping, parallel_mapping, reconciliate_sep, affix, type_affix_sep, validate_output, sort_key, raise_errors, **kwargs)
 
 
-def load_extract(data, with_mapping, with_loader, parallel_mapping = 0, affix="none", type_affix_sep=":", validate_output = False, raise_errors = True, progress_bar = False, **kwargs) -> Tuple[list[Tuple], list[Tuple]]:
+def _dedup(elements, seen):
+    """Keep only the elements having a serialization that is not in seen, and add it there.
+
+    The serialization is the same than the one used by the adapters when `dedup` is True.
+    """
+    kept = []
+    for elem in elements:
+        k = str(elem)
+        if k not in seen:
+            seen.add(k)
+            kept.append(elem)
+    return kept
+
+
+def load_extract(data, with_mapping, with_loader, parallel_mapping = 0, affix="none", type_affix_sep=":", validate_output = False, raise_errors = True, progress_bar = False, dedup = False, **kwargs) -> Tuple[list[Tuple], list[Tuple]]:
     """ Load the given data with the given loader, and apply the given mapping on it.
 
         Args:
@@ -385,6 +399,7 @@ def load_extract(data, with_mapping, with_loader, parallel_mapping = 0, affix="n
             validate_output: if True, calls the validate section of the mapping, if any
             raise_errors: if True, stop at the first error, if False, try to proceed anyway
             progress_bar: if True, will show progress bars
+            dedup: if True, will not return the nodes and edges that have the same serialization than an already returned one
             kwargs: arguments passed to the loader function
 
         Returns:
@@ -433,20 +448,23 @@ def load_extract(data, with_mapping, with_loader, parallel_mapping = 0, affix="n
     logger.info(f"Run {type(adapter).__name__}...")
     if parallel_mapping > 0:
         logger.debug(f"\tin parallel over {parallel_mapping} cores")
-        adapter.__call__()
-        nodes += list(adapter.nodes)
-        edges += list(adapter.edges)
     else:
         logger.debug("\tsequentially")
-        for ln,le in adapter():
-            nodes += ln
-            edges += le
+    # In both cases, the adapter yields the elements created for each item.
+    seen_nodes = set()
+    seen_edges = set()
+    for ln,le in adapter():
+        if dedup:
+            ln = _dedup(ln, seen_nodes)
+            le = _dedup(le, seen_edges)
+        nodes += ln
+        edges += le
     logger.debug("OK — adapter ran.")
 
     return nodes, edges
 
 
-def extract(data_to_mapping, parallel_mapping = 0, affix="none", type_affix_sep=":", validate_output = False, raise_errors = True, progress_bar = False, **kwargs) -> Tuple[list[Tuple], list[Tuple]]:
+def extract(data_to_mapping, parallel_mapping = 0, affix="none", type_affix_sep=":", validate_output = False, raise_errors = True, progress_bar = False, dedup = False, **kwargs) -> Tuple[list[Tuple], list[Tuple]]:
     """
     Extracts nodes and edges from tabular data files based on provided mappings.
 
@@ -459,6 +477,7 @@ def extract(data_to_mapping, parallel_mapping = 0, affix="none", type_affix_sep=
         validate_output: Whether to validate the output of the transformers. Defaults to False.
         raise_errors: Whether to raise errors encountered during the mapping, and stop the mapping process. Defaults to True.
         progress_bar: if True, will show progress bars
+        dedup: if True, will not return the nodes and edges that have the same serialization than an already returned one, across all the data. Defaults to False.
         kwargs: A dictionary of arguments to pass to pandas.read_* functions.
 
     Returns:
@@ -467,6 +486,8 @@ def extract(data_to_mapping, parallel_mapping = 0, affix="none", type_affix_sep=
 
     nodes = []
     edges = []
+    seen_nodes = set()
+    seen_edges = set()
 
     lpf = loader.LoadPandasFile(progress_bar)
     lpd = loader.LoadPandasDataframe()
@@ -492,6 +513,9 @@ def extract(data_to_mapping, parallel_mapping = 0, affix="none", type_affix_sep=
                 except Exception as e:
                     logger.error(f"While loading `{data}` and mapping with `{mapping}`.")
                     raise e
+                if dedup:
+                    ln = _dedup(ln, seen_nodes)
+                    le = _dedup(le, seen_edges)
                 nodes += ln
                 edges += le
                 break
@@ -508,7 +532,7 @@ def extract(data_to_mapping, parallel_mapping = 0, affix="none", type_affix_sep=
     return nodes, edges
 
 
-def extract_table(df: pd.DataFrame, config: dict, parallel_mapping = 0, affix = "suffix", type_affix_sep = ":", validate_output = False, raise_errors = True):
+def extract_table(df: pd.DataFrame, config: dict, parallel_mapping = 0, affix = "suffix", type_affix_sep = ":", validate_output = False, raise_errors = True, dedup = False):
     """
     Proxy function for extracting from a table all nodes, edges and properties
     that are defined in a PandasAdapter configuration.
@@ -522,6 +546,7 @@ def extract_table(df: pd.DataFrame, config: dict, parallel_mapping = 0, affix =
         type_affix_sep (str): The type_affix_sep to use between labels and type annotations (default is ":").
         validate_output: Whether to validate the output of the transformers. Defaults to False.
         raise_errors: Whether to raise errors encountered during the mapping, and stop the mapping process. Defaults to True.
+        dedup: if True, will not return the nodes and edges that have the same serialization than an already returned one. Defaults to False.
 
     Returns:
         PandasAdapter: The configured adapter.
@@ -532,10 +557,78 @@ def extract_table(df: pd.DataFrame, config: dict, parallel_mapping = 0, affix =
         affix,
         type_affix_sep,
         validate_output,
-        raise_errors
+        raise_errors,
+        dedup = dedup,
     )
 
 
+def extract_table_chunked(filename, config, chunksize = 100_000, parallel_mapping = 0, affix = "suffix", type_affix_sep = ":", validate_output = False, raise_errors = True, dedup = False, **kwargs) -> Tuple[list[Tuple], list[Tuple]]:
+    """
+    Extracts nodes and edges from a delimited text file, without loading the whole table in memory.
+
+    The file is read by chunks of rows, each chunk being mapped by its own PandasAdapter,
+    so that only one chunk of the table is held in memory at a time.
+    The mapping is parsed only once, hence the declared types are shared by all the chunks.
+
+    Args:
+        filename (str): The name of the data file (one of the extensions read by `pandas.read_csv`: .csv, .tsv, .txt, .dat).
+        config: The mapping, either as a dictionary or as the name of a YAML file.
+        chunksize (int): The number of rows read at once.
+        parallel_mapping (int): Number of workers to use in parallel mapping. Defaults to 0 for sequential processing.
+        affix (str): The type affix to use (default is "suffix").
+        type_affix_sep (str): The type_affix_sep to use between labels and type annotations (default is ":").
+        validate_output: Whether to validate the output of the transformers. Defaults to False.
+        raise_errors: Whether to raise errors encountered during the mapping, and stop the mapping process. Defaults to True.
+        dedup: if True, will not return the nodes and edges that have the same serialization than an already returned one, across all the chunks. Defaults to False.
+        kwargs: A dictionary of arguments to pass to pandas.read_csv.
+
+    Returns:
+        tuple: Two lists of tuples containing nodes and edges.
+    """
+    lpf = loader.LoadPandasFile()
+    ext = pathlib.Path(filename).suffix
+    if ext not in lpf.read_funcs or lpf.read_funcs[ext][0] != lpf.read_csv_progress:
+        msg = f"I can only read delimited text files by chunks, not `{filename}`."
+        logger.error(msg)
+        raise exceptions.FeatureError(msg)
+    # Use the same defaults than when loading the whole file.
+    kw = dict(lpf.read_funcs[ext][1])
+    kw.update(kwargs)
+
+    if not isinstance(config, dict):
+        with open(config, 'r') as fd:
+            config = yaml.full_load(fd)
+    parser = mapping.YamlParser(
+        config,
+        validate_output=validate_output,
+        raise_errors = raise_errors,
+    )
+    mapper = parser()
+
+    nodes = []
+    edges = []
+    seen_nodes = set()
+    seen_edges = set()
+    for chunk in pd.read_csv(filename, chunksize = chunksize, **kw):
+        logger.debug(f"Map a chunk of {len(chunk)} rows...")
+        adapter = tabular.PandasAdapter(
+            chunk,
+            *mapper,
+            type_affix=affix,
+            type_affix_sep=type_affix_sep,
+            parallel_mapping=parallel_mapping,
+            raise_errors = raise_errors,
+        )
+        for ln,le in adapter():
+            if dedup:
+                ln = _dedup(ln, seen_nodes)
+                le = _dedup(le, seen_edges)
+            nodes += ln
+            edges += le
+
+    return nodes, edges
+
+
 def extract_OWL(graph: rdflib.Graph, config: dict, parallel_mapping = 0, affix = "suffix", type_affix_sep = ":", validate_output = False, raise_errors = True):
     """
     Proxy function for extracting from a table all nodes, edges and properties
@@ -1,14 +1,20 @@
 """ Interfaces for OntoWeaver.
 """
+import os
+import sys
+import shutil
+import pickle
+import weakref
+import tempfile
 import logging
 import math
 
 import types as pytypes
 import pandas as pd
+import pandera.pandas as pa
 
 from collections.abc import Iterable
 from abc import ABCMeta as ABSTRACT, abstractmethod
-from abc import abstractmethod as abstract
 from typing import TypeAlias
 from typing import Optional
 from enum import Enum, EnumMeta
@@ -22,26 +28,38 @@ from . import types as owtypes
 logger = logging.getLogger("ontoweaver")
 
 
-def is_not_null(val):
+def _is_not_null_str(sval):
+    return sval != "" and sval != "None" and sval.lower() != "nan"
+
+
+def is_not_null(val, is_not_null_str = _is_not_null_str):
     """
     Checks if cell value is not empty nor 'null', 'nan'...
 
     Args:
         val: The value to check.
+        is_not_null_str: The check to use for strings, and for the values
+            that are neither strings nor numbers, once converted to strings.
 
     Returns:
         bool: True if the value is valid, False otherwise.
     """
-    if pd.api.types.is_numeric_dtype(type(val)):
-        if (math.isnan(val) or val == float("nan")):
+    # Fast paths for the most common cell types,
+    # avoiding the costly dtype inference of Pandas.
+    cls = type(val)
+    if cls is str:
+        return is_not_null_str(val)
+    elif cls is float:
+        return not math.isnan(val)
+    elif cls is int or cls is bool:
+        return True
+
+    if pd.api.types.is_numeric_dtype(cls):
+        if math.isnan(val):
             return False
-    elif str(val).lower() == "nan":  # Conversion from Pandas' `object` needs to be explicit.
-        return False
-    elif str(val) == "":
-        return False
-    elif str(val) == 'None':
-        return False
-    return True
+        return True
+    # Conversion from Pandas' `object` needs to be explicit.
+    return is_not_null_str(str(val))
 
 
 class MetaEnum(EnumMeta):
@@ -98,57 +116,108 @@ class ErrorManager:
         return err
 
 
-class Element(metaclass = ABSTRACT):
+# Element subclasses, by name, for each module name.
+# Populated at class declaration, see Element.__init_subclass__ and All.
+_module_elements = {}
+# Incremented at each registration, so that caches depending on the registry can be invalidated.
+_module_elements_version = 0
+
+# Serializers are stateless, hence elements share those default instances.
+_default_serializer = serialize.All()
+_default_node_serializer = serialize.node.All()
+_default_edge_serializer = serialize.edge.All()
+
+
+class Element:
     """Base class for either Node or Edge.
 
-    Manages allowed properties mechanics."""
+    Manages allowed properties mechanics.
+
+    This is not an abstract base class, because isinstance checks on ABCMeta classes
+    are slower and are done for each element. Methods that should be overridden
+    raise a NotImplementedError."""
+
+    # Elements are instantiated for each mapped item, so we avoid the per-instance __dict__.
+    __slots__ = ('_id', '_label', '_properties', '_serializer', '_str_cache', '_hash_cache')
+
+    # Set to True to type-check the properties of each instantiated element.
+    _check_properties = False
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Register by name, so that a redeclared class replaces the previous one,
+        # as it would do as a module attribute.
+        _module_elements.setdefault(cls.__module__, {})[cls.__name__] = cls
+        global _module_elements_version
+        _module_elements_version += 1
 
     def __init__(self,
                  id        : Optional[str] = None,
-                 properties: Optional[dict[str,str]] = {},
+                 properties: Optional[dict[str,str]] = None,
                  label     : Optional[str] = None,
-                 serializer: Optional[serialize.Serializer] = serialize.All(),
+                 serializer: Optional[serialize.Serializer] = None,
                  ):
         """Instantiate an element.
 
         :param str id: Unique identifier of the element. If id == None, is then set to the empty string.
-        :param dict[str,str] properties: All available properties for this instance.
+        :param dict[str,str] properties: All available properties for this instance. If None, is then set to an empty dictionary.
         :param str label: The label of the element.
         :param serializer: an instance indicating what to serialize to get a unique ID
         """
+        # Serialization and its hash are memoized, see __str__.
+        self._str_cache = None
+        self._hash_cache = None
+
         if not id:
             self._id = ''
         else:
-            self._id = str(id)
+            self._id = sys.intern(str(id))
 
         # Use the setter to get sanity checks.
+        # Do not share a default dictionary between instances.
+        if properties is None:
+            properties = {}
         self.properties = properties
 
         if not label:
             # Do not change the name here, or BioCypher will have problem
             # finding back labels.
-            self._label = self.__class__.__name__ 
+            self._label = sys.intern(self.__class__.__name__)
         else:
-            self._label = str(label)
+            self._label = sys.intern(str(label))
 
+        if serializer is None:
+            serializer = _default_serializer
         self.serializer = serializer
 
     def __str__(self):
-        return self.serializer(self)
+        # Hashing and comparison are done on the serialization,
+        # which is thus computed only once, and reset by the setters.
+        # It is interned, so that comparing identical serializations
+        # is (most of the time) a pointer comparison.
+        if self._str_cache is None:
+            self._str_cache = sys.intern(self.serializer(self))
+            self._hash_cache = hash(self._str_cache)
+        return self._str_cache
 
     def __hash__(self):
-        return hash(self.__str__())
+        if self._hash_cache is None:
+            self.__str__()
+        return self._hash_cache
 
     def __eq__(self, other):
+        if self is other:
+            return True
+        if not isinstance(other, Element):
+            # Let Python try the reflected comparison, or fall back to identity.
+            return NotImplemented
         return self.__str__() == other.__str__()
 
     @staticmethod
-    @abstract
     def fields() -> list[str]:
         """List of property fields provided by the (sub)class."""
         raise NotImplementedError
 
-    @abstract
     def as_tuple(self):
         """Convert the element class into Biocypher's expected tuple.
 
@@ -157,10 +226,9 @@ class Element(metaclass = ABSTRACT):
         raise NotImplementedError
 
     @classmethod
-    @abstract
     def from_tuple(cls,
                    biocypher_tuple : tuple,
-                   serializer: Optional[serialize.Serializer] = serialize.All()
+                   serializer: Optional[serialize.Serializer] = None
         ):
         # return cls(biocypher_tuple,serializer)
         raise NotImplementedError
@@ -173,19 +241,38 @@ class Element(metaclass = ABSTRACT):
     def label(self) -> str:
         return self._label
 
+    @property
+    def serializer(self) -> serialize.Serializer:
+        return self._serializer
+
+    @serializer.setter
+    def serializer(self, serializer: serialize.Serializer):
+        self._serializer = serializer
+        # The serialization depends on the serializer.
+        self._str_cache = None
+        self._hash_cache = None
+
     @property
     def properties(self) -> dict[str,str]:
+        """The properties of the element.
+
+        The serialization (and thus the hash) of the element is memoized,
+        and includes the properties with the default serializer.
+        Modifying the returned dictionary in place, once the element has been
+        hashed or compared, is thus not supported: assign a new dictionary instead."""
         return self._properties
 
     @properties.setter
     def properties(self, properties: dict[str,str]):
         """Set available properties.
 
-        Asserts that the passed properties are in the declared fields."""
+        Checks that the passed properties are a dictionary,
+        if the `_check_properties` class attribute is True."""
 
-        # Sanity checks:
-        assert(properties is not None)
-        assert(type(properties) == dict)
+        # Sanity checks, disabled by default because this is called for each element.
+        if __debug__ and self._check_properties:
+            if not isinstance(properties, dict):
+                raise TypeError(f"Properties of `{type(self).__name__}` should be a dict, not a `{type(properties).__name__}`.")
         # logger.debug(f"Properties of `{type(self).__name__}`: {list(properties.keys())}, available: {list(self.available())}")
         # TODO enable the usage of available() function to disable / enable parts of ontology / certain nodes
         # for p in properties:
@@ -193,40 +280,49 @@ class Element(metaclass = ABSTRACT):
         #         logger.error(f"\t\tProperty `{p}` should be available for type `{type(self).__name__}`, available ones: `{list(self.available())}`")
         #         assert(p in self.available())
         self._properties = properties
+        self._str_cache = None
+        self._hash_cache = None
 
 
 class Node(Element):
     """Base class for any Node."""
 
+    __slots__ = ()
+
     def __init__(self,
                  id        : Optional[str] = None,
-                 properties: Optional[dict[str,str]] = {},
+                 properties: Optional[dict[str,str]] = None,
                  label     : Optional[str] = None,  # Set from subclass name.
-                 serializer: Optional[serialize.Serializer] = serialize.node.All(),
+                 serializer: Optional[serialize.Serializer] = None,
                  ):
         """Instantiate a Node.
 
         :param str id: Unique identifier of the node. If id == None, is then set to the empty string.
-        :param dict[str,str] properties: All available properties for this instance.
+        :param dict[str,str] properties: All available properties for this instance. If None, is then set to an empty dictionary.
         :param str label: The label of the node.
         :param serializer: an instance indicating what to serialize to get a unique ID
         """
+        if serializer is None:
+            serializer = _default_node_serializer
         super().__init__(id = id, properties = properties, label = label, serializer = serializer)
 
     Tuple: TypeAlias = tuple[str,str,dict[str,str]]
     def as_tuple(self) -> Tuple:
-        """Export the Node as a Biocypher tuple."""
+        """Export the Node as a Biocypher tuple.
+
+        The properties dictionary is not copied.
+        It is not shared between nodes either, as BioCypher modifies it."""
         return (
             self._id,
             self._label,
             # FIXME this has been changed to keep ALL properties. No checking if allowed
-            self.properties
+            self._properties
         )
 
     @classmethod
     def from_tuple(cls,
                    biocypher_tuple : tuple[str,str,dict[str,str]],
-                   serializer: Optional[serialize.Serializer] = serialize.node.All(),
+                   serializer: Optional[serialize.Serializer] = None,
                    ):
         assert(len(biocypher_tuple) == 3)
         return cls(
@@ -239,18 +335,9 @@ class Node(Element):
         """List of property fields provided by the (sub)class."""
         return list(self.properties.keys())
 
-    def __str__(self):
-        return self.serializer(self)
-
     def __repr__(self):
         return f"({self.label}:{self.id}/{self.properties})"
 
-    def __hash__(self):
-        return hash(self.__str__())
-
-    def __eq__(self, other):
-        return self.__str__() == other.__str__()
-
     # def serialize(self):
     #     return {
     #         "id": self._id,
@@ -262,34 +349,50 @@ class Node(Element):
 class Edge(Element):
     """Base class for any Edge."""
 
+    __slots__ = ('_id_source', '_id_target')
+
+    # Whether source_type() and target_type() are the generic Node, see __init_subclass__.
+    _source_is_node = False
+    _target_is_node = False
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Types are static, so they are checked once per class instead of at each __repr__.
+        try:
+            cls._source_is_node = cls.source_type() == Node
+            cls._target_is_node = cls.target_type() == Node
+        except NotImplementedError:
+            # Intermediate class not declaring its types.
+            pass
+
     def __init__(self,
                  id        : Optional[str] = None,
                  id_source : Optional[str] = None,
                  id_target : Optional[str] = None,
-                 properties: Optional[dict[str,str]] = {},
+                 properties: Optional[dict[str,str]] = None,
                  label     : Optional[str] = None,  # Set from subclass name.
-                 serializer: Optional[serialize.Serializer] = serialize.edge.All(),
+                 serializer: Optional[serialize.Serializer] = None,
                  ):
         """Instantiate an Edge.
 
         :param str id: Unique identifier of the edge. If id == None, is then set to the empty string.
         :param str id_source: Unique identifier of the source Node. If None, is then set to the empty string.
         :param str id_target: Unique identifier of the target Node. If None, is then set to the empty string.
-        :param dict[str,str] properties: All available properties for this instance.
+        :param dict[str,str] properties: All available properties for this instance. If None, is then set to an empty dictionary.
         :param str label: The label of the node.
         :param comparer: an instance indicating what to serialize to get a unique ID
         """
+        if serializer is None:
+            serializer = _default_edge_serializer
         super().__init__(id = id, properties = properties, label = label, serializer = serializer)
         self._id_source = str(id_source)
         self._id_target = str(id_target)
 
     @staticmethod
-    @abstract
     def source_type():
         raise NotImplementedError
 
     @staticmethod
-    @abstract
     def target_type():
         raise NotImplementedError
 
@@ -300,6 +403,8 @@ class Edge(Element):
     @id_source.setter
     def id_source(self, id_source):
         self._id_source = id_source
+        self._str_cache = None
+        self._hash_cache = None
 
     @property
     def id_target(self):
@@ -308,23 +413,27 @@ class Edge(Element):
     @id_target.setter
     def id_target(self, id_target):
         self._id_target = id_target
+        self._str_cache = None
+        self._hash_cache = None
 
     Tuple: TypeAlias = tuple[str,str,str,dict[str,str]]
     def as_tuple(self) -> Tuple:
-        """Export the Edge as a Biocypher tuple."""
+        """Export the Edge as a Biocypher tuple.
+
+        The properties dictionary is not copied, see Node.as_tuple."""
         return (
             self._id,
             self._id_source,
             self._id_target,
             self._label,
             #.FIXME no checking if properties are allowed allowed_properties()
-            self.properties
+            self._properties
         )
 
     @classmethod
     def from_tuple(cls,
                    biocypher_tuple : tuple[str,str,str,str,dict[str,str]],
-                   serializer: Optional[serialize.Serializer] = serialize.edge.All()
+                   serializer: Optional[serialize.Serializer] = None
                    ):
         assert(len(biocypher_tuple) == 5)
         logging.debug(biocypher_tuple)
@@ -337,13 +446,13 @@ class Edge(Element):
             serializer = serializer)
 
     def __repr__(self):
-        if self.source_type() == Node:
+        if self._source_is_node:
             st = "."
         elif self.source_type() == None:
             st = ""
         else:
             st = f"{self.source_type().__name__}"
-        if self.target_type() == Node:
+        if self._target_is_node:
             tt = "."
         else:
             tt = f"{'>'.join([t.__name__ for t in self.target_type()])}"
@@ -354,15 +463,6 @@ class Edge(Element):
         """List of property fields provided by the (sub)class."""
         return list(self.properties.keys())
 
-    def __str__(self):
-        return self.serializer(self)
-
-    def __hash__(self):
-        return hash(self.__str__())
-
-    def __eq__(self, other):
-        return self.__str__() == other.__str__()
-
     # def serialize(self):
     #     return {
     #         "id": self._id,
@@ -376,20 +476,22 @@ class Edge(Element):
 class GenericEdge(Edge):
     """Base class for any Edge."""
 
+    __slots__ = ()
+
     def __init__(self,
                  id        : Optional[str] = None,
                  id_source : Optional[str] = None,
                  id_target : Optional[str] = None,
-                 properties: Optional[dict[str,str]] = {},
+                 properties: Optional[dict[str,str]] = None,
                  label     : Optional[str] = None,  # Set from subclass name.
-                 serializer: Optional[serialize.Serializer] = serialize.edge.All(),
+                 serializer: Optional[serialize.Serializer] = None,
                  ):
         """Instantiate an Edge.
 
         :param str id: Unique identifier of the edge. If id == None, is then set to the empty string.
         :param str id_source: Unique identifier of the source Node. If None, is then set to the empty string.
         :param str id_target: Unique identifier of the target Node. If None, is then set to the empty string.
-        :param dict[str,str] properties: All available properties for this instance.
+        :param dict[str,str] properties: All available properties for this instance. If None, is then set to an empty dictionary.
         :param str label: The label of the node.
         :param comparer: an instance indicating what to serialize to get a unique ID
         """
@@ -410,63 +512,214 @@ class GenericEdge(Edge):
 class Adapter(errormanager.ErrorManager, metaclass = ABSTRACT):
     """Base class for implementing an adapter that consumes tabular data."""
 
-    def __init__(self, raise_errors = True):
+    def __init__(self, raise_errors = True, dedup = False, stream_to = None, stream_batch = 10000):
         """Allow to indicate which Element subclasses and which property fields
         are allowed to be exported by Biocypher.
+
+        Args:
+            raise_errors (bool): if True, will raise an exception when an error is encountered, else, will log the error and try to proceed.
+            dedup (bool): if True, will not store nodes or edges that have the same serialization than an already stored one.
+            stream_to (str): if not None, the directory in which stored nodes and edges are written as Parquet files, instead of being kept in memory.
+                The files are written in a temporary sub-directory owned by the adapter, which is removed along with the adapter.
+                This only bounds the memory used by the elements stored in the adapter, and read back with `nodes` and `edges`:
+                the `extract*` functions gather the elements yielded by the adapter instead, and do not use it.
+            stream_batch (int): the number of nodes (or edges) kept in memory before being written in stream_to.
         """
-        self._nodes = []
-        self._edges = []
         self.errors = []
+        self.dedup = dedup
+        self.stream_to = stream_to
+        self.stream_batch = stream_batch
+        self._node_files: list[str] = []
+        self._edge_files: list[str] = []
+        self._stream_dir = None
+        if self.stream_to:
+            os.makedirs(self.stream_to, exist_ok = True)
+            # Each adapter writes in a directory of its own, so that the files
+            # of several adapters streaming to the same place cannot collide.
+            self._stream_dir = tempfile.mkdtemp(prefix = "ontoweaver_", dir = self.stream_to)
+            # Remove the directory when the adapter is collected (or at exit),
+            # whatever happened during the mapping.
+            weakref.finalize(self, shutil.rmtree, self._stream_dir, ignore_errors = True)
+        self.clear_elements()
         super().__init__(raise_errors)
 
 
+    def clear_elements(self) -> None:
+        """Forget all the nodes and edges stored so far."""
+        for f in self._node_files + self._edge_files:
+            os.remove(f)
+        self._node_files = []
+        self._edge_files = []
+        # Elements are stored column-wise (one list per member of the BioCypher tuples),
+        # which avoids holding one tuple object per element.
+        self._node_ids: list[str] = []
+        self._node_labels: list[str] = []
+        self._node_props: list[dict] = []
+        self._edge_ids: list[str] = []
+        self._edge_sources: list[str] = []
+        self._edge_targets: list[str] = []
+        self._edge_labels: list[str] = []
+        self._edge_props: list[dict] = []
+        # Serializations of the stored elements, used if dedup is True.
+        self._node_keys: set[str] = set()
+        self._edge_keys: set[str] = set()
+        # Number of elements written in stream_to.
+        self._nb_streamed_nodes = 0
+        self._nb_streamed_edges = 0
+
+    def nb_nodes(self) -> int:
+        """Number of stored nodes."""
+        return self._nb_streamed_nodes + len(self._node_ids)
+
+    def nb_edges(self) -> int:
+        """Number of stored edges."""
+        return self._nb_streamed_edges + len(self._edge_ids)
+
+    def _store_node(self, node_tuple: Node.Tuple) -> None:
+        id, label, properties = node_tuple
+        self._node_ids.append(id)
+        self._node_labels.append(label)
+        self._node_props.append(properties)
+        if self.stream_to and len(self._node_ids) >= self.stream_batch:
+            self._stream_nodes()
+
+    def _store_edge(self, edge_tuple: Edge.Tuple) -> None:
+        id, id_source, id_target, label, properties = edge_tuple
+        self._edge_ids.append(id)
+        self._edge_sources.append(id_source)
+        self._edge_targets.append(id_target)
+        self._edge_labels.append(label)
+        self._edge_props.append(properties)
+        if self.stream_to and len(self._edge_ids) >= self.stream_batch:
+            self._stream_edges()
+
+    def _stream_nodes(self) -> None:
+        """Write the nodes kept in memory as a Parquet file in stream_to and forget them."""
+        filename = os.path.join(self._stream_dir, f"nodes_{len(self._node_files)}.parquet")
+        logger.debug(f"Stream {len(self._node_ids)} nodes to `{filename}`")
+        pd.DataFrame({
+            "id": self._node_ids,
+            "label": self._node_labels,
+            # Properties do not share the same keys, so they cannot be stored as columns.
+            # They are pickled, so that they are read back with the very same types.
+            "properties": [pickle.dumps(p) for p in self._node_props],
+        }).to_parquet(filename)
+        self._node_files.append(filename)
+        self._nb_streamed_nodes += len(self._node_ids)
+        self._node_ids = []
+        self._node_labels = []
+        self._node_props = []
+
+    def _stream_edges(self) -> None:
+        """Write the edges kept in memory as a Parquet file in stream_to and forget them."""
+        filename = os.path.join(self._stream_dir, f"edges_{len(self._edge_files)}.parquet")
+        logger.debug(f"Stream {len(self._edge_ids)} edges to `{filename}`")
+        pd.DataFrame({
+            "id": self._edge_ids,
+            "id_source": self._edge_sources,
+            "id_target": self._edge_targets,
+            "label": self._edge_labels,
+            "properties": [pickle.dumps(p) for p in self._edge_props],
+        }).to_parquet(filename)
+        self._edge_files.append(filename)
+        self._nb_streamed_edges += len(self._edge_ids)
+        self._edge_ids = []
+        self._edge_sources = []
+        self._edge_targets = []
+        self._edge_labels = []
+        self._edge_props = []
+
     def nodes_append(self, node_s) -> None:
         """Append an Node (or each Node in a list of nodes) to the internal list of nodes."""
-        if issubclass(type(node_s), Node):
-            nodes = [node_s]
+        if isinstance(node_s, Node):
+            node_s = (node_s,)
+
+        if self.dedup:
+            # The serialization is cached and interned, so this is a single set lookup.
+            for node in node_s:
+                k = str(node)
+                if k not in self._node_keys:
+                    self._node_keys.add(k)
+                    self._store_node(node.as_tuple())
+        elif not self.stream_to:
+            # Extend each column at once, instead of storing the nodes one by one.
+            tuples = [node.as_tuple() for node in node_s]
+            if tuples:
+                ids, labels, props = zip(*tuples)
+                self._node_ids.extend(ids)
+                self._node_labels.extend(labels)
+                self._node_props.extend(props)
         else:
-            nodes = node_s
-
-        # logger.debug(f"Nodes: {nodes}.")
-        for node in nodes:
-            # logger.debug(f"\tAppend node {node}.")
-            # Checking for duplicates in reconciliation, otherwise complexity too high.
-            self._nodes.append(node.as_tuple())
-            # return True
+            for node in node_s:
+                self._store_node(node.as_tuple())
 
     def edges_append(self, edge_s) -> None:
         """Append an Edge (or each Edge in a list of edges) to the internal list of edges."""
-        if issubclass(type(edge_s), Edge):
-            edges = [edge_s]
+        if isinstance(edge_s, Edge):
+            edge_s = (edge_s,)
+
+        if self.dedup:
+            for edge in edge_s:
+                k = str(edge)
+                if k not in self._edge_keys:
+                    self._edge_keys.add(k)
+                    self._store_edge(edge.as_tuple())
+        elif not self.stream_to:
+            tuples = [edge.as_tuple() for edge in edge_s]
+            if tuples:
+                ids, sources, targets, labels, props = zip(*tuples)
+                self._edge_ids.extend(ids)
+                self._edge_sources.extend(sources)
+                self._edge_targets.extend(targets)
+                self._edge_labels.extend(labels)
+                self._edge_props.extend(props)
         else:
-            edges = edge_s
-
-        # logger.debug(f"Edges: {edges}.")
-        for edge in edges:
-            # logger.debug(f"\tAppend edge {edge}.")
-            # Checking for duplicates in reconciliation, otherwise complexity too high.
-            self._edges.append(edge.as_tuple())
-            # return True
+            for edge in edge_s:
+                self._store_edge(edge.as_tuple())
 
     @property
     def nodes(self) -> Iterable[Node.Tuple]:
-        """Return a generator yielding nodes."""
-        for n in self._nodes:
-            yield n
+        """Return an iterator over nodes, as BioCypher tuples.
+
+        If stream_to is set, nodes are read back from the written files first."""
+        if not self._node_files:
+            return zip(self._node_ids, self._node_labels, self._node_props)
+        return self._iter_streamed_nodes()
 
     @property
     def edges(self) -> Iterable[Edge.Tuple]:
-        """Return a generator yielding edges."""
-        for e in self._edges:
-            yield e
+        """Return an iterator over edges, as BioCypher tuples.
+
+        If stream_to is set, edges are read back from the written files first."""
+        if not self._edge_files:
+            return zip(self._edge_ids, self._edge_sources, self._edge_targets, self._edge_labels, self._edge_props)
+        return self._iter_streamed_edges()
+
+    def _iter_streamed_nodes(self):
+        for filename in self._node_files:
+            df = pd.read_parquet(filename)
+            yield from zip(df["id"], df["label"], (pickle.loads(p) for p in df["properties"]))
+        yield from zip(self._node_ids, self._node_labels, self._node_props)
+
+    def _iter_streamed_edges(self):
+        for filename in self._edge_files:
+            df = pd.read_parquet(filename)
+            yield from zip(df["id"], df["id_source"], df["id_target"], df["label"], (pickle.loads(p) for p in df["properties"]))
+        yield from zip(self._edge_ids, self._edge_sources, self._edge_targets, self._edge_labels, self._edge_props)
 
     @abstractmethod
     def run(self):
         raise NotImplementedError()
 
     def __call__(self):
-        for local_nodes, local_edges in self.run():
-            yield local_nodes, local_edges
+        try:
+            for local_nodes, local_edges in self.run():
+                yield local_nodes, local_edges
+        except Exception:
+            # Do not leave the files of a failed mapping behind.
+            if self.stream_to:
+                self.clear_elements()
+            raise
 
 
 class Declare(errormanager.ErrorManager):
@@ -501,12 +754,15 @@ class Declare(errormanager.ErrorManager):
             The created node class.
         """
         # If type already exists, return it.
-        if hasattr(self.module, name):
-            cls = getattr(self.module, name)
-            logger.debug(
-                f"\t\tNode class `{name}` (prop: `{cls.fields()}`) already exists, I will not create another one.")
+        # This is the most common case, as types are referenced by many transformers.
+        cls = getattr(self.module, name, None)
+        if cls is not None:
+            cls_fields = cls.fields()
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    f"\t\tNode class `{name}` (prop: `{cls_fields}`) already exists, I will not create another one.")
             for p in properties.values():
-                if p not in cls.fields():
+                if p not in cls_fields:
                     logger.warning(f"\t\t\tProperty `{p}` not found in declared fields for node class `{cls.__name__}`.")
             return cls
 
@@ -515,6 +771,8 @@ class Declare(errormanager.ErrorManager):
 
         attrs = {
             "__module__": self.module.__name__,
+            # The attributes are all slotted in the base classes, avoid a per-instance __dict__.
+            "__slots__": (),
             "fields": staticmethod(fields),
         }
         t = pytypes.new_class(name, (base,), {}, lambda ns: ns.update(attrs))
@@ -544,8 +802,8 @@ class Declare(errormanager.ErrorManager):
             The created edge class.
         """
         # If type already exists, check if the fields are the same.
-        if hasattr(self.module, name):
-            cls = getattr(self.module, name)
+        cls = getattr(self.module, name, None)
+        if cls is not None:
             cls_fields = cls.fields()
 
             # Compare the properties with the existing class fields
@@ -572,6 +830,7 @@ class Declare(errormanager.ErrorManager):
 
         attrs = {
             "__module__": self.module.__name__,
+            "__slots__": (),
             "fields": staticmethod(fields),
             "source_type": staticmethod(st),
             "target_type": staticmethod(tt),
@@ -605,6 +864,15 @@ class MappingParser(Declare):
     k_final_type = ["final_type", "final_object", "final_node", "final_subject", "final_label", "final_target"]
     k_reverse_edge = ["reverse_relation", "reverse_edge", "reverse_predicate", "reverse_link"]
     k_match_type_from = ["match_type_from_column", "match_type_from_element"]
+    # Keys that are not passed as parameters to the transformers, see YamlParser.get_not.
+    # Sets are used because only the membership matters, not the priority order of the synonyms.
+    k_not_property_params = frozenset(k_target + k_edge + k_columns)
+    k_not_subject_params = frozenset(k_subject_type + k_columns)
+    k_not_target_params = frozenset(k_target + k_edge + k_columns + k_final_type + k_reverse_edge)
+    # Sets of synonyms, for testing if any of them is used in a configuration dictionary.
+    k_properties_keys = frozenset(k_properties)
+    k_target_keys = frozenset(k_target)
+    k_match_type_from_keys = frozenset(k_match_type_from)
 
 
 class Transformer(errormanager.ErrorManager):
@@ -645,9 +913,9 @@ class Transformer(errormanager.ErrorManager):
         self.label_maker = label_maker
         self.branching_properties = branching_properties
         self.columns = columns
+        if not output_validator:
+            output_validator = validate.OutputValidator(validate.default_validation_rules, raise_errors = raise_errors)
         self.output_validator = output_validator
-        if not self.output_validator:
-            self.output_validator = validate.OutputValidator(validate.default_validation_rules, raise_errors = raise_errors)
         self.parameters = kwargs
         self.multi_type_dict = multi_type_dict
         self.final_type = None # The final type is to be passed by the label maker class based on the YAML mapping. That
@@ -658,6 +926,19 @@ class Transformer(errormanager.ErrorManager):
 
         self.declare_types = Declare()
 
+        # The representation is used in many log messages, see __repr__.
+        self._repr_cache = None
+
+
+    @property
+    def output_validator(self):
+        return self._output_validator
+
+    @output_validator.setter
+    def output_validator(self, output_validator):
+        self._output_validator = output_validator
+        # Resolved once here, as validate() is called for each produced value.
+        self._check_output = output_validator.scalar_check()
 
 
     def get_transformer(self):
@@ -682,21 +963,17 @@ class Transformer(errormanager.ErrorManager):
 
 
     #FIXME: The functions below are never implemented.
-    @abstractmethod
     def nodes(self):
         raise NotImplementedError
 
-    @abstractmethod
     def edges(self):
         raise NotImplementedError
 
     @staticmethod
-    @abstractmethod
     def edge_type():
         raise NotImplementedError
 
     @staticmethod
-    @abstractmethod
     def target_type():
        raise NotImplementedError
 
@@ -705,6 +982,11 @@ class Transformer(errormanager.ErrorManager):
        return cls.edge_type().source_type()
 
     def __repr__(self):
+        if self._repr_cache is None:
+            self._repr_cache = self._build_repr()
+        return self._repr_cache
+
+    def _build_repr(self):
 
         representation = ""
 
@@ -786,20 +1068,13 @@ class Transformer(errormanager.ErrorManager):
         Validate the output of the transformer, using the output_validator. of the transformer instance.
         """
         try:
-            if isinstance(self.output_validator, validate.SimpleOutputValidator) or isinstance(self.output_validator, validate.SkipValidator):
-                # The SimpleOutputValidator and SkipValidator do not use the Pandera package, and the value is therefore not
-                # required to be in a DataFrame format. Voiding the creation of a DataFrame here saves computational time for
-                # large datasets.
-                if self.output_validator(res):
-                    return True
-                else:
-                    return False
+            # The SimpleOutputValidator and SkipValidator do not use the Pandera package, and check the value directly.
+            # The OutputValidator checks it against a prebuilt Series schema, see validate.OutputValidator.validate_scalar.
+            if self._check_output(res):
+                return True
             else:
-                if self.output_validator(pd.DataFrame([res], columns=["cell_value"])):
-                    return True
-                else:
-                    return False
-        except pa.errors.SchemaErrors as error:
+                return False
+        except (pa.errors.SchemaError, pa.errors.SchemaErrors) as error:
             msg = f"Transformer {self.__repr__()} did not produce valid data {error}."
             self.error(msg, exception = exceptions.DataValidationError)
 
@@ -819,8 +1094,11 @@ class Transformer(errormanager.ErrorManager):
             return None, None, None, None
         if result_object.target_node_type:
             self.target_type = result_object.target_node_type.__name__
-        if result_object.target_element_properties is not None:
+        if result_object.target_element_properties is not None \
+           and result_object.target_element_properties is not self.properties_of:
             self.properties_of = result_object.target_element_properties
+            # The representation shows the properties.
+            self._repr_cache = None
         self.final_type = result_object.final_type
         return result_object.extracted_cell_value, result_object.edge_type, result_object.target_node_type, result_object.reverse_relation
 
@@ -842,18 +1120,14 @@ class All:
 
     def __init__(self, module):
         self.module = module
+        # Cached fields, along with the registry version at which they were gathered.
+        self._fields = {}
 
     def elements(self, asked: Element = Element) -> list[Element]:
-        m = self.module.__dict__
-        classes = []
-        for c in m:
-            if isinstance(m[c], type) \
-            and m[c].__module__ == self.module.__name__ \
-            and issubclass(m[c], asked):
-                classes.append(m[c])
-                logger.debug(f"Found `{asked.__name__}` class: `{m[c]}` (prop: `{m[c].fields()}`).")
-                # t = m[c]
-                # logger.debug(f"\t\t#### {t.mro()[:-3]}/{t.__name__} => {t.fields()}")
+        classes = [c for c in _module_elements.get(self.module.__name__, {}).values() if issubclass(c, asked)]
+        if logger.isEnabledFor(logging.DEBUG):
+            for c in classes:
+                logger.debug(f"Found `{asked.__name__}` class: `{c}` (prop: `{c.fields()}`).")
         return classes
 
     def nodes(self) -> list[Node]:
@@ -862,15 +1136,17 @@ class All:
     def edges(self) -> list[Edge]:
         return self.elements(Edge)
 
+    def _gather_fields(self, asked: Element) -> list[str]:
+        version, names = self._fields.get(asked, (None, None))
+        if version != _module_elements_version:
+            # Unique names, in the order of declaration.
+            names = list(dict.fromkeys(f for c in self.elements(asked) for f in c.fields()))
+            self._fields[asked] = (_module_elements_version, names)
+        return list(names)
+
     def node_fields(self) -> list[str]:
-        names = [] # FIXME use a set?
-        for c in self.nodes():
-            names += c.fields()
-        return names
+        return self._gather_fields(Node)
 
     def edge_fields(self) -> list[str]:
-        names = [] # FIXME use a set?
-        for c in self.edges():
-            names += c.fields()
-        return names
+        return self._gather_fields(Edge)
 
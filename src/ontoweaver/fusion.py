@@ -116,7 +116,7 @@ def remap_edges(edges, ID_mapping):
     """
 
     for et in edges:
-        edge = base.GenericEdge.from_tuple(et, serialize.edge.All())
+        edge = base.GenericEdge.from_tuple(et)
 
         s = ID_mapping.get(edge.id_source, None)
         if s:
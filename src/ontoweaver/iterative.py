@@ -2,16 +2,20 @@
 """
 
 import sys
+import uuid
 import logging
+import functools
 import threading
+import multiprocessing
 
 import pandas as pd
 
 from typing import Optional
-from itertools import chain
+from itertools import chain, islice
+from collections import deque
 from alive_progress import alive_bar
 from collections.abc import Iterable
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 from abc import ABCMeta as ABSTRACT, abstractmethod
 
 from . import base
@@ -21,9 +25,87 @@ from . import validate
 
 logger = logging.getLogger("ontoweaver")
 
+
+# Adapters mapping items in parallel, see IterativeAdapter._map_parallel.
+# The worker processes are forked, so that they inherit the adapters,
+# which thus do not have to be pickled: only the batches of items are sent to them.
+# Each adapter is registered under its own key, so that several adapters
+# can map items in parallel at the same time.
+_forked_adapters = {}
+
+def _process_batch(key, batch):
+    """Process a batch of items with the registered adapter, in a worker process.
+
+    Returns:
+        The index of each item along with the result of _process_row for it,
+        and the validation error messages recorded by each output validator
+        while processing this batch (see IterativeAdapter._output_validators).
+    """
+    adapter = _forked_adapters[key]
+    # The worker only sends back the messages of this batch,
+    # the parent process adds them to its own validators.
+    validators = adapter._output_validators()
+    for validator in validators:
+        validator.messages = {}
+    results = [(row_data[0], adapter._process_row(row_data)) for row_data in batch]
+    return results, [validator.messages for validator in validators]
+
+
+def _batches(items, size):
+    """Group the given items in lists of (at most) the given size, lazily."""
+    items = iter(items)
+    while True:
+        batch = list(islice(items, size))
+        if not batch:
+            return
+        yield batch
+
+
+def _bounded_map(executor, func, batches, in_flight):
+    """Submit the batches to the executor, keeping at most in_flight of them at once.
+
+    Unlike Executor.map, this does not consume all the batches beforehand,
+    so that the items are not all held in memory.
+
+    Yields:
+        The results of func on each batch, in order.
+    """
+    pending = deque()
+    for batch in batches:
+        pending.append(executor.submit(func, batch))
+        if len(pending) >= in_flight:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def _is_not_nan_str(sval):
+    return sval != "nan"
+
+
+# How to format an ID, depending on where the type is added.
+_id_formats = {
+    base.TypeAffixes.prefix: lambda entry_type, entry_name, sep: f"{entry_type}{sep}{entry_name}",
+    base.TypeAffixes.suffix: lambda entry_type, entry_name, sep: f"{entry_name}{sep}{entry_type}",
+    base.TypeAffixes.none:   lambda entry_type, entry_name, sep: f"{entry_name}",
+}
+
+@functools.lru_cache(maxsize = 1 << 17)
+def _format_id(entry_type, entry_name, type_affix, type_affix_sep):
+    """Format an ID, see IterativeAdapter.make_id.
+
+    The same entries are generally found in many rows, hence the cache.
+    It is shared by all the adapters, so this must not have any side effect.
+    """
+    return _id_formats[type_affix](entry_type, entry_name, type_affix_sep)
+
+
 class IterativeAdapter(base.Adapter, metaclass = ABSTRACT):
     """Base class for implementing a Biocypher adapter that consumes iterative data."""
 
+    # Number of items sent at once to a worker, in parallel mapping.
+    parallel_batch = 1024
+
     def __init__(self,
                  subject_transformer: base.Transformer,
                  transformers: Iterable[base.Transformer],
@@ -34,6 +116,8 @@ class IterativeAdapter(base.Adapter, metaclass = ABSTRACT):
                  parallel_mapping: int = 0,
                  raise_errors = True,
                  progress_bar = False,
+                 dedup = False,
+                 stream_to = None,
                  ):
         """
         Instantiate the adapter.
@@ -47,8 +131,10 @@ class IterativeAdapter(base.Adapter, metaclass = ABSTRACT):
             parallel_mapping (int): Number of workers to use in parallel mapping. Defaults to 0 for sequential processing.
             raise_errors (bool): if True, will raise an exception when an error is encountered, else, will log the error and try to proceed.
             progress_bar: if True, will show a progress bar while processing the data
+            dedup (bool): if True, will not store duplicated nodes and edges.
+            stream_to (str): if not None, the directory in which the stored nodes and edges are written, instead of keeping them in memory (see base.Adapter).
         """
-        super().__init__(raise_errors)
+        super().__init__(raise_errors, dedup, stream_to)
 
         self.validator = validator
 
@@ -62,8 +148,11 @@ class IterativeAdapter(base.Adapter, metaclass = ABSTRACT):
         self.subject_transformer = subject_transformer
         assert self.subject_transformer
         self.transformers = transformers
+        self._plan = () # What to do with each transformer, see self._make_plan.
+        self._from_subject_index = {} # Transformers for each `from_subject` type name, see self._from_subject_candidates.
         self.property_transformers = [] # populated at parsing in self.properties.
         self.metadata = metadata
+        self._metadata_items = {} # Metadata of each element type, populated in self.properties.
         # logger.debug(self.target_element_properties)
         self.parallel_mapping = parallel_mapping
 
@@ -115,15 +204,11 @@ class IterativeAdapter(base.Adapter, metaclass = ABSTRACT):
         if '[' in entry_name or ']' in entry_name:
             logger.warning(f"Identifier `{entry_name}` (of type `{entry_type}`) contains brackets. Maybe you should use a `split` transformer for this column?")
 
-        if self.type_affix == base.TypeAffixes.prefix:
-            idt = f'{entry_type}{self.type_affix_sep}{entry_name}'
-        elif self.type_affix == base.TypeAffixes.suffix:
-            idt = f'{entry_name}{self.type_affix_sep}{entry_type}'
-        elif self.type_affix == base.TypeAffixes.none:
-            idt = f'{entry_name}'
+        idt = _format_id(entry_type, entry_name, self.type_affix, self.type_affix_sep)
 
         if idt:
-            logger.debug(f"\t\tFormatted ID `{idt}` for cell value `{entry_name}` of type: `{entry_type}`")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"\t\tFormatted ID `{idt}` for cell value `{entry_name}` of type: `{entry_type}`")
             return idt
         else:
             self.error(f"Failed to format ID for cell value: `{entry_name}` of type: `{entry_type}`", exception = exceptions.DeclarationError)
@@ -139,12 +224,8 @@ class IterativeAdapter(base.Adapter, metaclass = ABSTRACT):
         Returns:
             bool: True if the value is valid, False otherwise.
         """
-        if pd.api.types.is_numeric_dtype(type(val)):
-            if (math.isnan(val) or val == float("nan")):
-                return False
-        elif str(val) == "nan":  # Conversion from Pandas' `object` needs to be explicit.
-            return False
-        return True
+        # Unlike base.is_not_null, only the "nan" string is not valid.
+        return base.is_not_null(val, _is_not_nan_str)
 
 
     def properties(self, property_dict, row, i, edge_t, node_t, node = False):
@@ -164,26 +245,36 @@ class IterativeAdapter(base.Adapter, metaclass = ABSTRACT):
         Returns:
             dict: Extracted properties.
         """
+        if not property_dict and not self.metadata:
+            # Common for relation-only edges.
+            # A new dictionary is returned anyway, because BioCypher modifies them afterwards.
+            return {}
+
         properties = {}
 
         if property_dict:
 
             for prop_transformer, property_name in property_dict.items():
-                properties[property_name] = []
+                values = []
+                properties[property_name] = values
 
                 for property_value, none_node, none_edge, none_reverse_relation \
                     in prop_transformer(row, i):
 
                     if property_value:
                         if isinstance(property_value, list):
-                            properties[property_name] += str(property_value)
+                            values += str(property_value)
+                        elif type(property_value) is str:
+                            # Most values are already strings (data are loaded as such), avoid converting them.
+                            values.append(property_value)
                         else:
-                            properties[property_name].append(str(property_value))
+                            values.append(str(property_value))
                         # properties[property_name] = str(property_value).replace("'", "`") # FIXME double-check why the old code needed this.
-                        logger.debug(
-                            f"                 {prop_transformer}" \
-                            f" to property `{property_name}` with value" \
-                            f" `{properties[property_name]}`." )
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.debug(
+                                f"                 {prop_transformer}" \
+                                f" to property `{property_name}` with value" \
+                                f" `{values}`." )
                     else:
                         self.error(
                             f"Failed to extract valid property with" \
@@ -191,18 +282,11 @@ class IterativeAdapter(base.Adapter, metaclass = ABSTRACT):
                             indent=2,
                             exception = exceptions.TransformerDataError )
 
-        # Collapse any list with less than one item to a string.
-        # to_delete = []
-        for k,v in properties.items():
-            # if len(v) == 0:
-            #     to_delete.append(k)
-            # el
-            if len(v) == 1:
-                properties[k] = v[0]
-
-        # We don't delete empty properties, because BioCypher would complain.
-        # for k in to_delete:
-            # del properties[k]
+                # Collapse any list with one item to a string,
+                # as soon as it is filled, instead of iterating over the properties again.
+                # We don't delete empty properties, because BioCypher would complain.
+                if len(values) == 1:
+                    properties[property_name] = values[0]
 
         # If the metadata dictionary is not empty, add the metadata to the property dictionary.
         if self.metadata:
@@ -210,9 +294,12 @@ class IterativeAdapter(base.Adapter, metaclass = ABSTRACT):
                 elem = node_t
             else:
                 elem = edge_t
-            if elem.__name__ in self.metadata:
-                for key, value in self.metadata[elem.__name__].items():
-                    properties[key] = value
+            # Metadata do not change across rows, so they are gathered once per type.
+            items = self._metadata_items.get(elem)
+            if items is None:
+                items = tuple(self.metadata.get(elem.__name__, {}).items())
+                self._metadata_items[elem] = items
+            properties.update(items)
 
         return properties
 
@@ -289,7 +376,8 @@ class IterativeAdapter(base.Adapter, metaclass = ABSTRACT):
                 source_node_id = self.make_id(subject_node_type.__name__, source_id)
 
                 if source_node_id:
-                    logger.debug(f"\t\tDeclared subject ID: {source_node_id}")
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(f"\t\tDeclared subject ID: {source_node_id}")
                     local_nodes.append(
                         self.make_node(
                             node_t = subject_node_type,
@@ -336,7 +424,8 @@ class IterativeAdapter(base.Adapter, metaclass = ABSTRACT):
                 target_node = transformer.final_type
 
             target_node_id = self.make_id(target_node.__name__, target_id)
-            logger.debug(f"\t\tMake node {target_node_id}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"\t\tMake node {target_node_id}")
             local_nodes.append(self.make_node(node_t=target_node, id=target_node_id,
                                               # FIXME: Should we use the meta-way of accessing node properties as well?
                                               # FIXME: This would require a refactoring of the transformer interfaces and tabular.run.
@@ -359,7 +448,7 @@ class IterativeAdapter(base.Adapter, metaclass = ABSTRACT):
 
         found_valid_subject = False
 
-        for t in self.transformers:
+        for t in self._from_subject_candidates(transformer.from_subject):
             if transformer.from_subject == t.target_type:
                 found_valid_subject = True
                 for s_id, s_edge, s_node, s_reverse_edge in t(row, i):
@@ -368,8 +457,8 @@ class IterativeAdapter(base.Adapter, metaclass = ABSTRACT):
                             s_node = t.final_type
                         subject_id = s_id
                         subject_node_id = self.make_id(t.target_type, subject_id)
-                        logger.debug(
-                            f"\t\tMake edge from {subject_node_id} toward {target_node_id}")
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.debug(f"\t\tMake edge from {subject_node_id} toward {target_node_id}")
                         local_edges.append(
                             self.make_edge(edge_t=target_edge, id_source=subject_node_id,
                                            id_target=target_node_id,
@@ -378,8 +467,8 @@ class IterativeAdapter(base.Adapter, metaclass = ABSTRACT):
 
                     else:
                         local_errors.append(self.error(
-                            f"No valid identifiers from {t} for {i}th row, when trying to change default subject type",
-                            f"by {transformer} with `from_subject` attribute.",
+                            f"No valid identifiers from {t} for {i}th row, when trying to change default subject type"
+                            f" by {transformer} with `from_subject` attribute.",
                             indent=7, section="transformers", index=j,
                             exception=exceptions.TransformerDataError))
 
@@ -394,6 +483,27 @@ class IterativeAdapter(base.Adapter, metaclass = ABSTRACT):
                                            exception=exceptions.ConfigError))
 
 
+    def _from_subject_candidates(self, from_subject):
+        """
+        Helper function returning the transformers that may produce nodes of the given type name,
+        in the order of self.transformers.
+
+        The actual type being known only once a transformer has produced a node,
+        the candidates are the transformers listing this type in their `multi_type_dict`
+        (or not declaring any).
+        They are gathered once per type name, instead of scanning all transformers for each target.
+        """
+        candidates = self._from_subject_index.get(from_subject)
+        if candidates is None:
+            candidates = []
+            for t in self.transformers:
+                if not t.multi_type_dict \
+                   or any(getattr(ty.get("to_object"), "__name__", None) == from_subject for ty in t.multi_type_dict.values()):
+                    candidates.append(t)
+            self._from_subject_index[from_subject] = candidates
+        return candidates
+
+
     def _no_element(self, local_nodes, local_edges, local_errors, local_rows, local_transformations, local_nb_nodes):
         if local_nodes == None or local_edges == None or local_errors == None \
             or local_rows == None or local_transformations == None or local_nb_nodes == None:
@@ -402,6 +512,73 @@ class IterativeAdapter(base.Adapter, metaclass = ABSTRACT):
         return False
 
 
+    def _map_parallel(self, process_row):
+        """
+        Process all the items over `parallel_mapping` workers.
+
+        The items are sent to the workers in batches of `parallel_batch` items,
+        with a bounded number of batches waiting to be processed,
+        so that the items are not all held in memory at once.
+        Worker processes are forked, so that they inherit the adapter;
+        only the batches of items and the produced elements are pickled.
+        The validation error messages recorded in the workers are added
+        to the output validators of this process. Any other state that
+        the transformers would update while processing items stays in the workers.
+        If forking is not available, or is not safe because
+        the process already runs several threads, fall back to threads.
+
+        Yields:
+            The index of each item and the result of process_row for this item, in order.
+        """
+        batches = _batches(self.iterate(), self.parallel_batch)
+        in_flight = 2 * self.parallel_mapping
+
+        if "fork" not in multiprocessing.get_all_start_methods():
+            logger.warning("Cannot fork processes on this platform, I will use threads for the parallel mapping.")
+            use_threads = True
+        elif threading.active_count() > 1:
+            # Forking a process that runs threads may deadlock the children,
+            # for instance if another thread holds a lock at the time of the fork.
+            # The adapter cannot be pickled either (its types are created at runtime),
+            # which rules out the other start methods.
+            logger.warning(f"This process runs {threading.active_count()} threads, forking it is not safe,"
+                           " I will use threads for the parallel mapping.")
+            use_threads = True
+        else:
+            use_threads = False
+
+        if use_threads:
+            def process_batch(batch):
+                return [(row_data[0], process_row(row_data)) for row_data in batch]
+            with ThreadPoolExecutor(max_workers = self.parallel_mapping) as executor:
+                for results in _bounded_map(executor, process_batch, batches, in_flight):
+                    yield from results
+            return
+
+        key = uuid.uuid4().hex
+        _forked_adapters[key] = self
+        try:
+            with ProcessPoolExecutor(max_workers = self.parallel_mapping, mp_context = multiprocessing.get_context("fork")) as executor:
+                validators = self._output_validators()
+                for results, messages in _bounded_map(executor, functools.partial(_process_batch, key), batches, in_flight):
+                    for validator, batch_messages in zip(validators, messages):
+                        validator.merge_messages(batch_messages)
+                    yield from results
+        finally:
+            del _forked_adapters[key]
+
+
+    def _output_validators(self):
+        """
+        Gather the distinct output validators of all the transformers, always in the same order.
+        """
+        validators = {}
+        for t in chain([self.subject_transformer], self.transformers, self.property_transformers):
+            if t.output_validator:
+                validators.setdefault(id(t.output_validator), t.output_validator)
+        return list(validators.values())
+
+
     def _run_all(self, process_row, nb_rows, nb_transformations, nb_nodes):
         """
         Perform the final logging after processing all rows.
@@ -409,67 +586,43 @@ class IterativeAdapter(base.Adapter, metaclass = ABSTRACT):
 
         if self.parallel_mapping > 0:
             logger.info(f"Processing dataframe in parallel. Number of workers set to: {self.parallel_mapping} ...")
-            # Process the dataset in parallel using ThreadPoolExecutor
-            with ThreadPoolExecutor() as executor:
-                # Map the process_row function across the dataframe
-                results = list(executor.map(process_row, self.iterate() ))
-
-            # Append the results in a thread-safe manner after all rows have been processed
-            i = 0
-            for local_nodes, local_edges, local_errors, local_rows, local_transformations, local_nb_nodes in results:
-                i += 1
+            # The results are appended by this process only, hence there is no need for locks.
+            for i, (local_nodes, local_edges, local_errors, local_rows, local_transformations, local_nb_nodes) in self._map_parallel(process_row):
                 if self._no_element(local_nodes, local_edges, local_errors, local_rows, local_transformations, local_nb_nodes):
                     # logger.warning(f"Processing row {i} led to no viable element, I'll just skip it.")
                     self.non_viable_rows.add(i)
                     continue
-                with self._nodes_lock:
-                    self.nodes_append(local_nodes)
-                with self._edges_lock:
-                    self.edges_append(local_edges)
-                with self._errors_lock:
-                    self.errors += local_errors
-                with self._row_lock:
-                    nb_rows += local_rows
-                with self._transformations_lock:
-                    nb_transformations += local_transformations
-                with self._local_nb_nodes_lock:
-                    nb_nodes += local_nb_nodes
-
-            assert len(self.nodes) > 0
+                self.nodes_append(local_nodes)
+                self.edges_append(local_edges)
+                self.errors += local_errors
+                nb_rows += local_rows
+                nb_transformations += local_transformations
+                nb_nodes += local_nb_nodes
+                yield local_nodes, local_edges
 
         elif self.parallel_mapping == 0:
             logger.debug("Processing data sequentially...")
-            if self.progress_bar:
-                with alive_bar(len(self), file=sys.stderr) as progress:
-                    for i, row in self.iterate():
-                        local_nodes, local_edges, local_errors, local_rows, local_transformations, local_nb_nodes = process_row((i, row))
-                        if self._no_element(local_nodes, local_edges, local_errors, local_rows, local_transformations, local_nb_nodes):
-                            # logger.warning(f"Processing row {i} led to no viable element, I'll just skip it.")
-                            self.non_viable_rows.add(i)
-                            continue
-                        self.nodes_append(local_nodes)
-                        self.edges_append(local_edges)
-                        self.errors += local_errors
-                        nb_rows += local_rows
-                        nb_transformations += local_transformations
-                        nb_nodes += local_nb_nodes
-                        yield local_nodes, local_edges
-                        progress()
-
-            else: # FIXME refactor to avoid duplicated code?
-                for i, row in self.iterate():
-                    local_nodes, local_edges, local_errors, local_rows, local_transformations, local_nb_nodes = process_row((i, row))
-                    if self._no_element(local_nodes, local_edges, local_errors, local_rows, local_transformations, local_nb_nodes):
+            # This is the hot loop of the sequential mapping,
+            # avoid looking up the same attributes for each row.
+            no_element = self._no_element
+            nodes_append = self.nodes_append
+            edges_append = self.edges_append
+            errors = self.errors
+            with alive_bar(len(self) if self.progress_bar else None, file=sys.stderr, disable = not self.progress_bar) as progress:
+                for row_data in self.iterate():
+                    local_nodes, local_edges, local_errors, local_rows, local_transformations, local_nb_nodes = process_row(row_data)
+                    if no_element(local_nodes, local_edges, local_errors, local_rows, local_transformations, local_nb_nodes):
                         # logger.warning(f"Processing row {i} led to no viable element, I'll just skip it.")
-                        self.non_viable_rows.add(i)
+                        self.non_viable_rows.add(row_data[0])
                         continue
-                    self.nodes_append(local_nodes)
-                    self.edges_append(local_edges)
-                    self.errors += local_errors
+                    nodes_append(local_nodes)
+                    edges_append(local_edges)
+                    errors += local_errors
                     nb_rows += local_rows
                     nb_transformations += local_transformations
                     nb_nodes += local_nb_nodes
                     yield local_nodes, local_edges
+                    progress()
 
         else:
             self.error(f"Invalid value for `parallel_mapping` ({self.parallel_mapping})."
@@ -495,138 +648,163 @@ class IterativeAdapter(base.Adapter, metaclass = ABSTRACT):
             logger.info(
                 f"Performed {nb_transformations} transformations with {1+len(self.transformers)} node transformers, producing {nb_nodes} nodes for {nb_rows} rows.")
 
-    # =============
-    # Run function
-    # =============
-
-    def run(self):
-        """Iterate through dataframe in parallel and map cell values according to YAML file, using a list of transformers."""
+    def _process_row(self, row_data):
+        """Process a single item and collect the created elements.
 
-        logger.debug("Run...")
-        # Thread-safe containers with their respective locks
-        self._nodes = []
-        self._edges = []
-        self._errors = []
-        self._nodes_lock = threading.Lock()
-        self._edges_lock = threading.Lock()
-        self._errors_lock = threading.Lock()
-        self._row_lock = threading.Lock()
-        self._transformations_lock = threading.Lock()
-        self._local_nb_nodes_lock = threading.Lock()
-
-        # Function to process a single row and collect operations
-        def process_row(row_data):
-            i, row = row_data
-            local_nodes = []
-            local_edges = []
-            local_errors = []
-            local_rows = 0
-            local_transformations = 0 # Count of transformations for this row. Does not include the property transformers.
-            local_nb_nodes = 0
+        Args:
+            row_data: a tuple holding the index of the item and the item itself.
 
+        Returns:
+            The lists of created nodes, edges and errors,
+            along with the counts of processed rows, transformations and nodes,
+            or only Nones if no subject could be created.
+        """
+        i, row = row_data
+        local_nodes = []
+        local_edges = []
+        local_errors = []
+        local_rows = 0
+        local_transformations = 0 # Count of transformations for this row. Does not include the property transformers.
+        local_nb_nodes = 0
+
+        # Avoid formatting debug messages for each row, if they are not to be logged.
+        debug = logger.isEnabledFor(logging.DEBUG)
+        # Bind the attributes used in the loops, to avoid looking them up for each element.
+        plan = self._plan or self._make_plan()
+        properties = self.properties
+        make_edge = self.make_edge
+        make_target_node_id = self._make_target_node_id
+        if debug:
             logger.debug(f"Process row {i}...")
-            local_rows += 1
+        local_rows += 1
 
-            # source_node_id = self._make_default_source_node_id(row, i, local_nodes, local_errors)
-            # if not source_node_id:
-            #     return None, None, None, None, None, None
-            for source_node_id in self._make_default_source_node_id(row, i, local_nodes, local_errors):
+        # source_node_id = self._make_default_source_node_id(row, i, local_nodes, local_errors)
+        # if not source_node_id:
+        #     return None, None, None, None, None, None
+        for source_node_id in self._make_default_source_node_id(row, i, local_nodes, local_errors):
+            if debug:
                 logger.debug(f"Got subject node id: `{source_node_id}`")
-                if source_node_id:
-                    local_nb_nodes += 1
-                else:
-                    return None, None, None, None, None, None
+            if source_node_id:
+                local_nb_nodes += 1
+            else:
+                return None, None, None, None, None, None
 
-                # Loop over list of transformer instances and label_maker corresponding nodes and edges.
-                # FIXME the transformer variable here shadows the transformer module.
-                for j,transformer in enumerate(self.transformers):
-                    local_transformations += 1
+            # Loop over list of transformer instances and label_maker corresponding nodes and edges.
+            # FIXME the transformer variable here shadows the transformer module.
+            for j, transformer, has_from_subject in plan:
+                local_transformations += 1
+                if debug:
                     logger.debug(f"\tCalling the {j}th transformer: {transformer}...")
-                    k = 0
-                    try:
-                        for target_id, target_edge, target_node, reverse_relation in transformer(row, i):
+                k = 0
+                try:
+                    for target_id, target_edge, target_node, reverse_relation in transformer(row, i):
+                        if debug:
                             logger.debug(f"\t\t{k}th element yielded by transformer")
-                            k += 1
-                            target_node_id = self._make_target_node_id(
-                                row,
-                                i,
-                                transformer,
-                                j,
-                                target_id,
-                                target_edge,
-                                target_node,
-                                local_nodes,
-                                local_errors
-                            )
+                        k += 1
+                        target_node_id = make_target_node_id(
+                            row,
+                            i,
+                            transformer,
+                            j,
+                            target_id,
+                            target_edge,
+                            target_node,
+                            local_nodes,
+                            local_errors
+                        )
 
-                            #If no valid target node id was created, an error is logged in the `_make_target_node_id` function,
-                            #and we move to the next iteration of the loop.
-                            if target_node_id is None:
-                                continue
-                            else:
-                                local_nb_nodes += 1
+                        #If no valid target node id was created, an error is logged in the `_make_target_node_id` function,
+                        #and we move to the next iteration of the loop.
+                        if target_node_id is None:
+                            continue
+                        else:
+                            local_nb_nodes += 1
 
-                                # If a `from_subject` attribute is present in the transformer, loop over the transformer
-                                # list to find the transformer instance mapping to the correct type, and then label_maker new
-                                # subject id.
+                            # If a `from_subject` attribute is present in the transformer, loop over the transformer
+                            # list to find the transformer instance mapping to the correct type, and then label_maker new
+                            # subject id.
 
-                                # FIXME add hook functions to be overloaded.
+                            # FIXME add hook functions to be overloaded.
 
-                                # FIXME: Make from_subject reference a list of subjects instead of using the add_edge function.
+                            # FIXME: Make from_subject reference a list of subjects instead of using the add_edge function.
 
-                                if hasattr(transformer, "from_subject"):
+                            if has_from_subject:
 
-                                    self._make_alternative_source_node_id(
-                                        row,
-                                        i,
-                                        transformer,
-                                        j,
-                                        target_node_id,
-                                        target_edge,
-                                        local_edges,
-                                        local_errors
-                                    )
+                                self._make_alternative_source_node_id(
+                                    row,
+                                    i,
+                                    transformer,
+                                    j,
+                                    target_node_id,
+                                    target_edge,
+                                    local_edges,
+                                    local_errors
+                                )
 
-                                else: # no attribute `from_subject` in `transformer`
+                            else: # no attribute `from_subject` in `transformer`
+                                if debug:
                                     logger.debug(f"\t\tMake edge {target_edge.__name__} from {source_node_id} toward {target_node_id}")
+                                local_edges.append(
+                                    make_edge(
+                                        edge_t=target_edge,
+                                        id_target=target_node_id,
+                                        id_source=source_node_id,
+                                        properties=properties(
+                                            target_edge.fields(),
+                                            row,
+                                            i,
+                                            target_edge,
+                                            target_node
+                                        )
+                                    )
+                                )
+
+                                if reverse_relation:
+                                    logger.info(f"\t\t\tMake reverse edge {reverse_relation.__name__} from {target_node_id} to {source_node_id}")
                                     local_edges.append(
-                                        self.make_edge(
-                                            edge_t=target_edge,
-                                            id_target=target_node_id,
-                                            id_source=source_node_id,
-                                            properties=self.properties(
-                                                target_edge.fields(),
+                                        make_edge(
+                                            edge_t=reverse_relation,
+                                            id_target=source_node_id,
+                                            id_source=target_node_id,
+                                            properties=properties(
+                                                reverse_relation.fields(),
                                                 row,
                                                 i,
-                                                target_edge,
-                                                target_node
+                                                reverse_relation,
+                                                source_node_id.__class__
                                             )
                                         )
                                     )
+                except Exception as err:
+                    logger.error(f"Error while calling the {j}th transformer on the {i}th row, after having yielded {k} items.")
+                    raise err
+        # assert hasattr(local_nodes, "__iter__")
+        # assert hasattr(local_edges, "__iter__")
+        return local_nodes, local_edges, local_errors, local_rows, local_transformations, local_nb_nodes
 
-                                    if reverse_relation:
-                                        logger.info(f"\t\t\tMake reverse edge {reverse_relation.__name__} from {target_node_id} to {source_node_id}")
-                                        local_edges.append(
-                                            self.make_edge(
-                                                edge_t=reverse_relation,
-                                                id_target=source_node_id,
-                                                id_source=target_node_id,
-                                                properties=self.properties(
-                                                    reverse_relation.fields(),
-                                                    row,
-                                                    i,
-                                                    reverse_relation,
-                                                    source_node_id.__class__
-                                                )
-                                            )
-                                        )
-                    except Exception as err:
-                        logger.error(f"Error while calling the {j}th transformer on the {i}th row, after having yielded {k} items.")
-                        raise err
-            # assert hasattr(local_nodes, "__iter__")
-            # assert hasattr(local_edges, "__iter__")
-            return local_nodes, local_edges, local_errors, local_rows, local_transformations, local_nb_nodes
-            # End of process_row local function
+
+    def _make_plan(self):
+        """
+        Helper function gathering, once for all rows, what the mapping loop needs to know about each transformer.
+
+        Returns:
+            A tuple of (index, transformer, has a `from_subject` attribute) tuples.
+        """
+        self._plan = tuple((j, t, hasattr(t, "from_subject")) for j, t in enumerate(self.transformers))
+        return self._plan
+
+
+    # =============
+    # Run function
+    # =============
+
+    def run(self):
+        """Iterate through dataframe in parallel and map cell values according to YAML file, using a list of transformers."""
+
+        logger.debug("Run...")
+        self.clear_elements()
+        self._errors = []
+        self._make_plan()
 
         nb_rows = 0
         nb_transformations = 0
@@ -634,21 +812,9 @@ class IterativeAdapter(base.Adapter, metaclass = ABSTRACT):
 
         if self.parallel_mapping > 0:
             logger.debug("\tParallel mapping...")
-            self._run_all(process_row, nb_rows, nb_transformations, nb_nodes)
         else:
             logger.debug("\tSequential mapping...")
-            for local_nodes,local_edges in self._run_all(process_row, nb_rows, nb_transformations, nb_nodes):
-                yield local_nodes, local_edges
-
-    def __call__(self):
-        # FIXME If the run functions contains a generator nested under an `if`, the call function is note even called by the derivated class instance..."
-        # if self.parallel_mapping > 0:
-        #     logger.debug("Parallel mapping")
-        #     self.run()
-        #     return
-        # else:
-        #     logger.debug("Sequential mapping")
-        for local_nodes, local_edges in self.run():
+        for local_nodes,local_edges in self._run_all(self._process_row, nb_rows, nb_transformations, nb_nodes):
             yield local_nodes, local_edges
 
     @abstractmethod
@@ -1,9 +1,10 @@
 """ Parsers handling mappings.
 """
-import yaml
+import copy
+import json
 import logging
 
-import pandera.pandas as pa
+from pandera.io.pandas_io import deserialize_schema
 
 from . import base
 from . import types
@@ -14,6 +15,29 @@ from . import make_labels
 
 logger = logging.getLogger("ontoweaver")
 
+
+def _make_schema(rules):
+    """Instantiate a Pandera DataFrameSchema from rules parsed from a mapping.
+
+    This is what `DataFrameSchema.from_yaml` does after having loaded the YAML,
+    hence there is no need to dump the rules back to YAML beforehand.
+    The rules are copied, because Pandera modifies some of the (nested) dictionaries.
+    """
+    return deserialize_schema(copy.deepcopy(rules))
+
+
+def _as_list(value, what):
+    """Wrap a value declared as a single string in the mapping into a list.
+
+    Lists and None are returned as is.
+    """
+    if value is None or isinstance(value, list):
+        return value
+    logger.debug(f"\tDeclared singular {what}: `{value}`")
+    assert isinstance(value, str), f"I was expecting a string or a list for the {what}, not `{value}`."
+    return [value]
+
+
 class YamlParser(base.MappingParser):
     """
     Parse a table extraction configuration and return the three objects needed to configure an Adapter.
@@ -70,6 +94,10 @@ class YamlParser(base.MappingParser):
         super().__init__(module, raise_errors = raise_errors)
         self.config = config
         self.validate_output = validate_output
+        # Output validation schemas, keyed by their rules, see self._make_output_validator.
+        self._schema_cache = {}
+        # What self.__call__ returns, the configuration being parsed only once.
+        self._mapping = None
         if not module:
             self.module = types
         else:
@@ -130,11 +158,13 @@ class YamlParser(base.MappingParser):
         """
         k_validate = ["validate"]
         validation_rules = self.get(k_validate)
-        yaml_validation_rules = yaml.dump(validation_rules, default_flow_style=False)
         validator = None
 
         try:
-            validation_schema = pa.DataFrameSchema.from_yaml(yaml_validation_rules)
+            if validation_rules:
+                validation_schema = _make_schema(validation_rules)
+            else:
+                validation_schema = validate.no_validation_rules
             validator = validate.InputValidator(validation_schema, raise_errors=self.raise_errors)
         except Exception as e:
             self.error(f"Failed to parse the input validation schema: {e}", exception=exceptions.ConfigError)
@@ -151,7 +181,7 @@ class YamlParser(base.MappingParser):
         Get the first dictionary (key, item) not matching any of the passed keys.
 
         Args:
-            keys: The keys to exclude.
+            keys: The keys to exclude (preferably a set, as it is tested for each key of the configuration).
             pconfig: The configuration dictionary to search in (default is self.config).
 
         Returns:
@@ -176,6 +206,8 @@ class YamlParser(base.MappingParser):
         Returns:
             The first item matching any of the passed keys, or None if no match is found.
         """
+        # The keys are scanned in order (and not intersected as sets),
+        # because the first synonym has priority if several are used.
         if not pconfig:
             pconfig = self.config
             assert pconfig, "I must have a configuration dictionary."
@@ -191,13 +223,13 @@ class YamlParser(base.MappingParser):
 
     def _extract_metadata(self, k_metadata_column, metadata_list, metadata, types, columns):
         """
-        Extract metadata and update the metadata dictionary.
+        Extract metadata and update the metadata dictionary, in place.
 
         Args:
             k_metadata_column (list): List of keys to be used for adding source column names.
             metadata_list (list): List of metadata items to be added.
             metadata (dict): The metadata dictionary to be updated.
-            types (str): The type of the node or edge.
+            types (str): The type of the node or edge (or a set of types).
             columns (list): List of columns to be added to the metadata.
 
         Returns:
@@ -205,7 +237,8 @@ class YamlParser(base.MappingParser):
         """
         if metadata_list and types:
             if not isinstance(types, set):
-                t = types
+                types = (types,)
+            for t in types:
                 metadata.setdefault(t, {})
                 for item in metadata_list:
                     metadata[t].update(item)
@@ -223,25 +256,6 @@ class YamlParser(base.MappingParser):
                         if columns:
                             # TODO make the separator a parameter.
                             metadata[t][key_name] = ", ".join(columns)
-            else:
-                for t in types:
-                    metadata.setdefault(t, {})
-                    for item in metadata_list:
-                        metadata[t].update(item)
-                    for key in k_metadata_column:
-                        if key in metadata[t]:
-                            # Use the value of k_metadata_column as the key.
-                            key_name = metadata[t][key]
-                            # Remove the k_metadata_column key from the metadata dictionary.
-                            if key_name in metadata[t]:
-                                msg = f"The key you used for adding source column names: `{key_name}` to node: `{t}` already exists in the metadata dictionary."
-                                # FIXME is it an error or a warning?
-                                # self.error(msg)
-                                logger.warning(msg)
-                            del metadata[t][key]
-                            if columns:
-                                # TODO make the separator a parameter.
-                                metadata[t][key_name] = ", ".join(columns)
 
             return metadata
         else:
@@ -264,8 +278,14 @@ class YamlParser(base.MappingParser):
                 # Adjust the formatting for output validation rules to match the expected format. This is so the
                 # user would not have to type `columns` and `cell_value` in the configuration file each time.
                 dict_output_validation_rules = {"columns": {"cell_value": output_validation_rules}}
-                yaml_output_validation_rules = yaml.dump(dict_output_validation_rules, default_flow_style=False)
-                output_validator.update_rules(pa.DataFrameSchema.from_yaml(yaml_output_validation_rules))
+                # Many transformers share the same rules, the schema is thus built once for each distinct rules.
+                # Validators are not shared, because they count their own errors.
+                key = json.dumps(dict_output_validation_rules, sort_keys = True, default = str)
+                schema = self._schema_cache.get(key)
+                if schema is None:
+                    schema = _make_schema(dict_output_validation_rules)
+                    self._schema_cache[key] = schema
+                output_validator.update_rules(schema)
             else:
                 output_validator = validate.SimpleOutputValidator(raise_errors=self.raise_errors)
         else:
@@ -285,15 +305,12 @@ class YamlParser(base.MappingParser):
                 properties_of.get(final_type, {})
             )
             possible_types.add(final_type_class.__name__)
-            extracted_s_final_type_metadata = self._extract_metadata(
+            self._extract_metadata(
                 base.MappingParser.k_metadata_column,
                 metadata_list, metadata,
                 final_type,
                 columns )
 
-            if extracted_s_final_type_metadata:
-                metadata.update(extracted_s_final_type_metadata)
-
             return final_type_class
 
         return None
@@ -339,16 +356,13 @@ class YamlParser(base.MappingParser):
 
                         possible_edge_types.add(alt_edge)
 
-                        extracted_alt_edge_metadata = self._extract_metadata(
+                        self._extract_metadata(
                             base.MappingParser.k_metadata_column,
                             metadata_list, metadata,
                             alt_edge,
                             None
                         )
 
-                        if extracted_alt_edge_metadata:
-                            metadata.update(extracted_alt_edge_metadata)
-
                         # Extract reverse edge, if specified in config.
                         alt_reverse_edge = self.get(base.MappingParser.k_reverse_edge, v)
                         if alt_reverse_edge:
@@ -360,7 +374,7 @@ class YamlParser(base.MappingParser):
                             )
 
                             possible_edge_types.add(alt_reverse_edge)
-                            extracted_alt_reverse_edge_metadata = self._extract_metadata(
+                            self._extract_metadata(
                                 base.MappingParser.k_metadata_column,
                                 metadata_list,
                                 metadata,
@@ -368,23 +382,15 @@ class YamlParser(base.MappingParser):
                                 None
                             )
 
-                            if extracted_alt_reverse_edge_metadata:
-                                metadata.update(extracted_alt_reverse_edge_metadata)
-
                         #TODO: Create new function or add this to make edge class?
 
-                    extracted_alt_type_metadata = self._extract_metadata(
+                    self._extract_metadata(
                         base.MappingParser.k_metadata_column,
                         metadata_list,
                         metadata,
                         alt_type,
                         columns
                     )
-                    if extracted_alt_type_metadata:
-                        metadata.update(extracted_alt_type_metadata)
-
-                    if extracted_alt_type_metadata:
-                        metadata.update(extracted_alt_type_metadata)
 
                     assert alt_type_class
                     multi_type_dictionary[key] = {
@@ -405,66 +411,83 @@ class YamlParser(base.MappingParser):
     # Property parsing
     # ============================================================
 
-    def parse_properties(self, properties_of, possible_subject_types, transformers_list):
+    def _transformer_items(self, transformers_list):
         """
-        Parse the properties of the transformers defined in the YAML mapping, and update the properties_of dictionary.
-        """
-        logger.debug(f"Parse properties...")
+        Flatten the `transformers` section of the YAML mapping, so that it is walked only once.
+
+        Each item of the section may declare several transformers,
+        and may be a single transformer name, without any field.
 
-        for n_transformer, transformer_types in enumerate(transformers_list):
+        Args:
+            transformers_list (list): The `transformers` section.
+
+        Returns:
+            list: (index of the item in the section, transformer type, fields dictionary, True if fields declare properties) tuples.
+        """
+        items = []
+        for transformer_index, transformer_types in enumerate(transformers_list):
             if not hasattr(transformer_types, "items"):
                 transformer_types = {transformer_types: []}
 
             for transformer_type, field_dict in transformer_types.items():
-                if not field_dict:
-                    logger.warning(f"There is no field for the {n_transformer}th transformer: '{transformer_type}',"
-                               f" did you forget an indentation?"
-                               f" If it is a User defined trasnformer, please disregard this warning. ")
-
-                    continue
-
-                if any(field in field_dict for field in base.MappingParser.k_properties):
-                    object_types = self.get(base.MappingParser.k_prop_to_object, pconfig=field_dict)
-                    property_names = self.get(base.MappingParser.k_properties, pconfig=field_dict)
-                    if not isinstance(property_names, list):
-                        logger.debug(f"\tDeclared singular property")
-                        assert isinstance(property_names, str)
-                        property_names = [property_names]
-                    if not object_types:  # FIXME: Creates errors with branching subject types and subject final type features.
-                        logger.info(
-                            f"No `for_objects` defined for properties {property_names}, I will attach those properties to the row subject(s) `{possible_subject_types}`")
-                        if isinstance(possible_subject_types, set) and len(possible_subject_types) == 1:
-                            object_types = list(possible_subject_types)[0]
-                        if isinstance(possible_subject_types, set) and len(possible_subject_types) > 1:
-                            object_types = list(possible_subject_types)
-                    if not isinstance(object_types, list):
-                        logger.debug(f"\tDeclared singular for_object: `{object_types}`")
-                        assert (isinstance(object_types, str))
-                        object_types = [object_types]
-
-                    column_names = self.get(base.MappingParser.k_columns, pconfig=field_dict)
-                    if column_names != None and not isinstance(column_names, list):
-                        logger.debug(f"\tDeclared singular column `{column_names}`")
-                        assert (isinstance(column_names, str))
-                        column_names = [column_names]
-                    gen_data = self.get_not(base.MappingParser.k_target + base.MappingParser.k_edge + base.MappingParser.k_columns, pconfig=field_dict)
-
-                    # Parse the validation rules for the output of the property transformer.
-                    p_output_validation_rules = self.get(base.MappingParser.k_validate_output, pconfig=field_dict)
-                    p_output_validator = self._make_output_validator(p_output_validation_rules)
-
-                    prop_transformer = self.make_transformer(
-                        transformer_type, columns=column_names,
-                        output_validator=p_output_validator,
-                        label_maker=make_labels.SimpleLabelMaker(
-                            raise_errors=self.raise_errors),
-                        **gen_data)
-
-                    for object_type in object_types:
-                        properties_of.setdefault(object_type, {})
-                        for property_name in property_names:
-                            properties_of[object_type].setdefault(prop_transformer, property_name)
-                        logger.debug(f"\t\tDeclared property mapping for `{object_type}`: {properties_of[object_type]}")
+                has_properties = bool(field_dict) and not field_dict.keys().isdisjoint(base.MappingParser.k_properties_keys)
+                items.append((transformer_index, transformer_type, field_dict, has_properties))
+        return items
+
+
+    def parse_properties(self, properties_of, possible_subject_types, transformer_items):
+        """
+        Parse the properties of the transformers defined in the YAML mapping, and update the properties_of dictionary.
+
+        The transformer_items are the ones returned by `_transformer_items`.
+        """
+        logger.debug(f"Parse properties...")
+
+        for n_transformer, transformer_type, field_dict, has_properties in transformer_items:
+            if not field_dict:
+                logger.warning(f"There is no field for the {n_transformer}th transformer: '{transformer_type}',"
+                           f" did you forget an indentation?"
+                           f" If it is a User defined trasnformer, please disregard this warning. ")
+
+                continue
+
+            if has_properties:
+                object_types = self.get(base.MappingParser.k_prop_to_object, pconfig=field_dict)
+                property_names = self.get(base.MappingParser.k_properties, pconfig=field_dict)
+                assert property_names is not None
+                property_names = _as_list(property_names, "property")
+                if not object_types:  # FIXME: Creates errors with branching subject types and subject final type features.
+                    logger.info(
+                        f"No `for_objects` defined for properties {property_names}, I will attach those properties to the row subject(s) `{possible_subject_types}`")
+                    if isinstance(possible_subject_types, set) and len(possible_subject_types) == 1:
+                        object_types = list(possible_subject_types)[0]
+                    if isinstance(possible_subject_types, set) and len(possible_subject_types) > 1:
+                        object_types = list(possible_subject_types)
+                assert object_types is not None
+                object_types = _as_list(object_types, "for_object")
+
+                column_names = self.get(base.MappingParser.k_columns, pconfig=field_dict)
+                column_names = _as_list(column_names, "column")
+                gen_data = self.get_not(base.MappingParser.k_not_property_params, pconfig=field_dict)
+
+                # Parse the validation rules for the output of the property transformer.
+                p_output_validation_rules = self.get(base.MappingParser.k_validate_output, pconfig=field_dict)
+                p_output_validator = self._make_output_validator(p_output_validation_rules)
+
+                prop_transformer = self.make_transformer(
+                    transformer_type, columns=column_names,
+                    output_validator=p_output_validator,
+                    label_maker=make_labels.SimpleLabelMaker(
+                        raise_errors=self.raise_errors),
+                    **gen_data)
+
+                for object_type in object_types:
+                    object_properties = properties_of.setdefault(object_type, {})
+                    # Properties are keyed by transformer, hence only the first property name can be kept.
+                    if property_names:
+                        object_properties.setdefault(prop_transformer, property_names[0])
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(f"\t\tDeclared property mapping for `{object_type}`: {object_properties}")
 
         return properties_of
 
@@ -472,7 +495,7 @@ class YamlParser(base.MappingParser):
     # Subject parsing
     # ============================================================
 
-    def parse_subject(self, properties_of, transformers_list, metadata_list, metadata):
+    def parse_subject(self, properties_of, transformer_items, metadata_list, metadata):
         """
         Parse the subject transformer and its properties from the YAML mapping.
         """
@@ -481,11 +504,11 @@ class YamlParser(base.MappingParser):
         subject_transformer_dict = self.get(base.MappingParser.k_row)
         if not subject_transformer_dict:
             msg = f"There is no `{'`, `'.join(base.MappingParser.k_row)}` key in your mapping."
-            logging.error(msg)
+            logger.error(msg)
             raise RuntimeError(msg)
 
         subject_transformer_class = list(subject_transformer_dict.keys())[0]
-        subject_kwargs = self.get_not(base.MappingParser.k_subject_type + base.MappingParser.k_columns, subject_transformer_dict[
+        subject_kwargs = self.get_not(base.MappingParser.k_not_subject_params, subject_transformer_dict[
             subject_transformer_class])  # FIXME shows redundant information filter out the keys that are not needed.
         subject_columns = self.get(
             base.MappingParser.k_columns,
@@ -493,10 +516,7 @@ class YamlParser(base.MappingParser):
         subject_final_type = self.get(
             base.MappingParser.k_final_type,
             subject_transformer_dict[subject_transformer_class] )
-        if subject_columns != None and not isinstance(subject_columns, list):
-            logger.debug(f"\tDeclared singular subject’s column `{subject_columns}`")
-            assert (isinstance(subject_columns, str))
-            subject_columns = [subject_columns]
+        subject_columns = _as_list(subject_columns, "subject’s column")
 
         # Parse the validation rules for the output of the subject transformer.
         subject_output_validation_rules = self.get(
@@ -542,7 +562,7 @@ class YamlParser(base.MappingParser):
                 subject_type = None
                 logger.debug("Parse subject transformer...")
 
-                if any(key in subject_kwargs for key in base.MappingParser.k_match_type_from):
+                if not subject_kwargs.keys().isdisjoint(base.MappingParser.k_match_type_from_keys):
                     s_label_maker = make_labels.MultiTypeOnColumnLabelMaker(
                         raise_errors=self.raise_errors,
                         match_type_from_column=self.get(base.MappingParser.k_match_type_from, subject_kwargs)
@@ -576,7 +596,7 @@ class YamlParser(base.MappingParser):
                 s_label_maker = make_labels.SimpleLabelMaker( raise_errors = self.raise_errors )
 
             # Append properties to subject type(s). In case other types are not declared.
-            properties_of = self.parse_properties(properties_of, possible_subject_types, transformers_list)
+            properties_of = self.parse_properties(properties_of, possible_subject_types, transformer_items)
 
             subject_transformer = self.make_transformer(
                 transformer_type = subject_transformer_class,
@@ -592,17 +612,18 @@ class YamlParser(base.MappingParser):
                 **subject_kwargs
             )
 
-            logger.debug(f"\tDeclared subject transformer: {subject_transformer}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"\tDeclared subject transformer: {subject_transformer}")
 
-            logger.debug(
-                f"\tDeclare subject of possible types: `{possible_subject_types}`, subject transformer: `{subject_transformer_class}`, "
-                f"subject kwargs: `{subject_kwargs}`, subject columns: '{subject_columns}'")
+                logger.debug(
+                    f"\tDeclare subject of possible types: `{possible_subject_types}`, subject transformer: `{subject_transformer_class}`, "
+                    f"subject kwargs: `{subject_kwargs}`, subject columns: '{subject_columns}'")
 
         else:
             logger.debug("\tSubject section does not have parameters.")
 
             # Still parse properties even if no subject transformer parameters are declared.
-            properties_of = self.parse_properties(properties_of, possible_subject_types, transformers_list)
+            properties_of = self.parse_properties(properties_of, possible_subject_types, transformer_items)
 
             logger.warning(f"No keywords declared for subject transformer `{subject_transformer_class}`"
                        f" Creating transformer with no parameters.")
@@ -615,15 +636,13 @@ class YamlParser(base.MappingParser):
             # Declare source type as None because no parameters were declared for the subject transformer.
             source_t = None
 
-        extracted_metadata = self._extract_metadata(
+        self._extract_metadata(
             base.MappingParser.k_metadata_column,
             metadata_list,
             metadata,
             possible_subject_types,
             subject_columns
         )
-        if extracted_metadata:
-            metadata.update(extracted_metadata)
 
         return possible_subject_types, subject_transformer, source_t, subject_columns
 
@@ -640,20 +659,20 @@ class YamlParser(base.MappingParser):
                        f"missing either a `to_object` or a `via_relation` in the mapping?.", "transformers", transformer_index,
                        indent=2, exception=exceptions.MissingDataError)
 
-        elif multi_type_dictionary and any(key in gen_data for key in base.MappingParser.k_match_type_from) and not target and not edge:
+        elif multi_type_dictionary and not gen_data.keys().isdisjoint(base.MappingParser.k_match_type_from_keys) and not target and not edge:
             label_maker = make_labels.MultiTypeOnColumnLabelMaker(
                 raise_errors=self.raise_errors,
                 match_type_from_column=self.get(base.MappingParser.k_match_type_from, gen_data)
             )
 
-        elif multi_type_dictionary and not target and not edge and not any(key in gen_data for key in base.MappingParser.k_match_type_from):
+        elif multi_type_dictionary and not target and not edge and gen_data.keys().isdisjoint(base.MappingParser.k_match_type_from_keys):
             label_maker = make_labels.MultiTypeLabelMaker(raise_errors=self.raise_errors)
         else:
             label_maker = make_labels.SimpleLabelMaker(raise_errors = self.raise_errors)
 
         return label_maker
 
-    def _check_target_sanity(self, transformer_keyword_dict, transformer_type, transformer_index, transformers, properties_of):
+    def _check_target_sanity(self, transformer_keyword_dict, transformer_type, transformer_index, transformers, properties_of, has_properties):
         """
         Preforms sanity checks on target transformer before assigning the target, edge and subject variables, and connected
         columns.
@@ -666,8 +685,8 @@ class YamlParser(base.MappingParser):
                                                              branching_properties=properties_of)
             transformers.append(target_transformer)
 
-        elif any(field in transformer_keyword_dict for field in base.MappingParser.k_properties):
-            if any(field in transformer_keyword_dict for field in base.MappingParser.k_target):
+        elif has_properties:
+            if not transformer_keyword_dict.keys().isdisjoint(base.MappingParser.k_target_keys):
                 prop = self.get(base.MappingParser.k_properties, transformer_keyword_dict)
                 target = self.get(base.MappingParser.k_target, transformer_keyword_dict)
                 col = self.get(base.MappingParser.k_columns, transformer_keyword_dict)
@@ -761,112 +780,106 @@ class YamlParser(base.MappingParser):
     # Target parsing
     # ============================================================
 
-    def parse_targets(self, transformers_list, properties_of, source_t, metadata_list, metadata):
+    def parse_targets(self, transformer_items, properties_of, source_t, metadata_list, metadata):
         """
         Parse the target transformers and their properties from the YAML mapping.
+
+        The transformer_items are the ones returned by `_transformer_items`.
         """
 
         transformers = []
         possible_target_types = set()
         possible_edge_types = set()
 
+        # Loop invariants.
+        get = self.get
+        get_not = self.get_not
+        extract_metadata = self._extract_metadata
+        k_metadata_column = base.MappingParser.k_metadata_column
+
         logger.debug("Declare types...")
         # Iterate through the list of target transformers and extract the information needed to create the
         # corresponding classes.
-        for transformer_index, target_transformer_yaml_dict in enumerate(transformers_list):
-            if not hasattr(target_transformer_yaml_dict, "items"):
-                target_transformer_yaml_dict = {target_transformer_yaml_dict: []}
-
-            for transformer_type, transformer_keyword_dict in target_transformer_yaml_dict.items():
-
-                target_branching = False
-                elements = self._check_target_sanity(transformer_keyword_dict, transformer_type, transformer_index, transformers, properties_of)
-                if elements is None:
-                    continue
-                # Transformer passed sanity check, unpack the returned elements.
-                else:
-                    # FIXME double-check why subject is unused here.
-                    columns, target, edge, subject, reverse_relation = elements
-
-                gen_data = self.get_not(base.MappingParser.k_target + base.MappingParser.k_edge + base.MappingParser.k_columns + base.MappingParser.k_final_type + base.MappingParser.k_reverse_edge, pconfig=transformer_keyword_dict)
-
-                # Extract the final type if defined in the mapping.
-                final_type = self.get(base.MappingParser.k_final_type, pconfig=transformer_keyword_dict)
-                final_type_class = self._extract_final_type_class(final_type, possible_target_types, metadata,
-                                                                  metadata_list, columns, properties_of)
-
-                # Harmonize the use of the `from_subject` and `from_source` synonyms in the configuration, because
-                # from_subject` is used in the transformer class to refer to the source node type.
-                if 'from_source' in gen_data:
-                    gen_data['from_subject'] = gen_data['from_source']
-                    del gen_data['from_source']
-
-                multi_type_dictionary = {}
-
-                # The target transformer is a simple transformer
-                # if it does not have a `match` clause.
-                # We create a simple multi_type_dictionary,
-                # with a "None" key, to indicate that no branching is needed.
-                if target and edge:
-                    # FIXME double-check why edge_t is unused here.
-                    edge_t, target_t = self._make_target_classes(target, properties_of, edge, source_t, final_type_class, reverse_relation, possible_target_types, possible_edge_types, multi_type_dictionary)
-                    # Parse the validation rules for the output of the transformer.
-                    # Each transformer gets its own
-                    # instance of the OutputValidator with (at least) the
-                    # default output validation rules.
-                    output_validation_rules = self.get(base.MappingParser.k_validate_output, pconfig=transformer_keyword_dict)
-                    # output_validator = self._make_output_validator(output_validation_rules)
-                    logger.debug(f"\tDeclare transformer `{transformer_type}`...")
-
-                # The target transformer is a branching transformer
-                # if it has a `match` clause.
-                # We create a branching dictionary.
-                # The keys of the dictionary are the regex patterns to be matched
-                # against the extracted value of the column.
-                if "match" in gen_data:
-
-                    target_branching = True
-                    self._make_branching_dict(
-                        subject = False,
-                        match_parser = gen_data["match"],
-                        properties_of = properties_of,
-                        metadata_list = metadata_list,
-                        metadata = metadata,
-                        columns = columns,
-                        final_type_class = final_type_class,
-                        multi_type_dictionary = multi_type_dictionary,
-                        possible_node_types = possible_target_types,
-                        possible_edge_types = possible_edge_types
-                    )
-
-                # Parse the validation rules for the output of the transformer. Each transformer gets its own
-                # instance of the OutputValidator with (at least) the default output validation rules.
-                output_validation_rules = self.get(base.MappingParser.k_validate_output, pconfig=transformer_keyword_dict)
-                output_validator = self._make_output_validator(output_validation_rules)
+        for transformer_index, transformer_type, transformer_keyword_dict, has_properties in transformer_items:
 
-                label_maker = self._make_target_label_maker(target, edge, gen_data, columns, transformer_index, multi_type_dictionary)
-                target_transformer = self.make_transformer(
-                    transformer_type = transformer_type,
-                    multi_type_dictionary = multi_type_dictionary,
-                    branching_properties = properties_of if target_branching else None,
-                    properties = properties_of.get(
-                        target_t.__name__,
-                        {}) if not target_branching else None,
+            target_branching = False
+            elements = self._check_target_sanity(transformer_keyword_dict, transformer_type, transformer_index, transformers, properties_of, has_properties)
+            if elements is None:
+                continue
+            # Transformer passed sanity check, unpack the returned elements.
+            else:
+                # FIXME double-check why subject is unused here.
+                columns, target, edge, subject, reverse_relation = elements
+
+            gen_data = get_not(base.MappingParser.k_not_target_params, pconfig=transformer_keyword_dict)
+
+            # Extract the final type if defined in the mapping.
+            final_type = get(base.MappingParser.k_final_type, pconfig=transformer_keyword_dict)
+            final_type_class = self._extract_final_type_class(final_type, possible_target_types, metadata,
+                                                              metadata_list, columns, properties_of)
+
+            # Harmonize the use of the `from_subject` and `from_source` synonyms in the configuration, because
+            # from_subject` is used in the transformer class to refer to the source node type.
+            if 'from_source' in gen_data:
+                gen_data['from_subject'] = gen_data['from_source']
+                del gen_data['from_source']
+
+            multi_type_dictionary = {}
+
+            # The target transformer is a simple transformer
+            # if it does not have a `match` clause.
+            # We create a simple multi_type_dictionary,
+            # with a "None" key, to indicate that no branching is needed.
+            if target and edge:
+                # FIXME double-check why edge_t is unused here.
+                edge_t, target_t = self._make_target_classes(target, properties_of, edge, source_t, final_type_class, reverse_relation, possible_target_types, possible_edge_types, multi_type_dictionary)
+                logger.debug(f"\tDeclare transformer `{transformer_type}`...")
+
+            # The target transformer is a branching transformer
+            # if it has a `match` clause.
+            # We create a branching dictionary.
+            # The keys of the dictionary are the regex patterns to be matched
+            # against the extracted value of the column.
+            if "match" in gen_data:
+
+                target_branching = True
+                self._make_branching_dict(
+                    subject = False,
+                    match_parser = gen_data["match"],
+                    properties_of = properties_of,
+                    metadata_list = metadata_list,
+                    metadata = metadata,
                     columns = columns,
-                    output_validator = output_validator,
-                    label_maker = label_maker,
-                    **gen_data
+                    final_type_class = final_type_class,
+                    multi_type_dictionary = multi_type_dictionary,
+                    possible_node_types = possible_target_types,
+                    possible_edge_types = possible_edge_types
                 )
-                transformers.append(target_transformer)
-                # Declare the metadata for the target and edge types.
 
-                extracted_metadata = self._extract_metadata(base.MappingParser.k_metadata_column, metadata_list, metadata, target, columns)
-                if extracted_metadata:
-                    metadata.update(extracted_metadata)
-                if edge:
-                    extracted_metadata = self._extract_metadata(base.MappingParser.k_metadata_column, metadata_list, metadata, edge, None)
-                    if extracted_metadata:
-                        metadata.update(extracted_metadata)
+            # Parse the validation rules for the output of the transformer. Each transformer gets its own
+            # instance of the OutputValidator with (at least) the default output validation rules.
+            output_validation_rules = get(base.MappingParser.k_validate_output, pconfig=transformer_keyword_dict)
+            output_validator = self._make_output_validator(output_validation_rules)
+
+            label_maker = self._make_target_label_maker(target, edge, gen_data, columns, transformer_index, multi_type_dictionary)
+            target_transformer = self.make_transformer(
+                transformer_type = transformer_type,
+                multi_type_dictionary = multi_type_dictionary,
+                branching_properties = properties_of if target_branching else None,
+                properties = properties_of.get(
+                    target_t.__name__,
+                    {}) if not target_branching else None,
+                columns = columns,
+                output_validator = output_validator,
+                label_maker = label_maker,
+                **gen_data
+            )
+            transformers.append(target_transformer)
+            # Declare the metadata for the target and edge types.
+
+            extract_metadata(k_metadata_column, metadata_list, metadata, target, columns)
+            if edge:
+                extract_metadata(k_metadata_column, metadata_list, metadata, edge, None)
 
         return transformers, possible_target_types, possible_edge_types, metadata
 
@@ -875,9 +888,16 @@ class YamlParser(base.MappingParser):
         """
         Parse the configuration and return the subject transformer and transformers.
 
+        The configuration does not depend on the data,
+        hence it is parsed at the first call only, later calls return the same objects.
+
         Returns:
             tuple: The subject transformer and a list of transformers.
         """
+        if self._mapping is not None:
+            logger.debug("Mapping already parsed.")
+            return self._mapping
+
         logger.debug("Parse mapping...")
 
         properties_of = {}
@@ -895,11 +915,14 @@ class YamlParser(base.MappingParser):
 
         metadata_list = self.get(base.MappingParser.k_metadata)
 
+        # Both the properties and the targets parsing walk the transformers.
+        transformer_items = self._transformer_items(transformers_list)
+
         # Parse subject type, metadata for subject, and properties for both subject and target types (parse_subject calls parse_properties).
-        possible_subject_types, subject_transformer, source_t, subject_columns = self.parse_subject(properties_of, transformers_list, metadata_list, metadata)
+        possible_subject_types, subject_transformer, source_t, subject_columns = self.parse_subject(properties_of, transformer_items, metadata_list, metadata)
 
         # Parse the target types and target metadata.
-        transformers, possible_target_types, possible_edge_types, metadata = self.parse_targets(transformers_list, properties_of, source_t, metadata_list, metadata)
+        transformers, possible_target_types, possible_edge_types, metadata = self.parse_targets(transformer_items, properties_of, source_t, metadata_list, metadata)
 
         validator = self._get_input_validation_rules()
 
@@ -916,27 +939,30 @@ class YamlParser(base.MappingParser):
                            " This could result in some empty or `nan` nodes." \
                            " To enable output validation set `validate_output` to `True`.")
 
-        if source_t:
-            logger.debug(f"source class: {source_t}")
-        elif possible_edge_types:
-            logger.debug(f"possible_source_types: {possible_subject_types}")
-
-        logger.debug("properties_of:")
-        for kind in properties_of:
-            for k in properties_of[kind]:
-                logger.debug(f"\t{kind}: {k} {properties_of[kind][k]}>")
-
-        logger.debug("transformers:")
-        for t in transformers:
-            logger.debug(f"\t{t}")
-
-        if len(metadata) > 0:
-            logger.debug("metadata:")
-            for k in metadata:
-                logger.debug(f"\t{metadata[k]}")
-        else:
-            logging.debug("No metadata")
+        # Representing all the transformers is costly, avoid it if it is not to be logged.
+        if logger.isEnabledFor(logging.DEBUG):
+            if source_t:
+                logger.debug(f"source class: {source_t}")
+            elif possible_edge_types:
+                logger.debug(f"possible_source_types: {possible_subject_types}")
+
+            logger.debug("properties_of:")
+            for kind in properties_of:
+                for k in properties_of[kind]:
+                    logger.debug(f"\t{kind}: {k} {properties_of[kind][k]}>")
+
+            logger.debug("transformers:")
+            for t in transformers:
+                logger.debug(f"\t{t}")
+
+            if len(metadata) > 0:
+                logger.debug("metadata:")
+                for k in metadata:
+                    logger.debug(f"\t{metadata[k]}")
+            else:
+                logger.debug("No metadata")
 
-        return subject_transformer, transformers, metadata, validator
+        self._mapping = (subject_transformer, transformers, metadata, validator)
+        return self._mapping
 
 
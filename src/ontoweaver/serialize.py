@@ -10,6 +10,9 @@ class Serializer(metaclass=ABSTRACT):
 
     This is used by congregate.Congretater to decide if two elements are duplicates.
     Elements having the same serialization will be considered as duplicates.
+
+    The serialization is interned by base.Element,
+    hence `__call__` must return an actual `str` (and not a subclass of it).
     """
 
     @abstractmethod
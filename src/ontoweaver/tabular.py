@@ -39,6 +39,9 @@ class PandasAdapter(iterative.IterativeAdapter):
     - `ontoweaver.types.all.edge_fields()`.
     """
 
+    # Number of rows converted at once by `iterate`.
+    iterate_batch = 1024
+
     def __init__(self,
             df: pd.DataFrame,
             subject_transformer: base.Transformer,
@@ -50,6 +53,8 @@ class PandasAdapter(iterative.IterativeAdapter):
             parallel_mapping: int = 0,
             raise_errors = True,
             progress_bar = False,
+            dedup = False,
+            stream_to = None,
         ):
 
         super().__init__(
@@ -61,7 +66,9 @@ class PandasAdapter(iterative.IterativeAdapter):
             type_affix_sep,
             parallel_mapping,
             raise_errors,
-            progress_bar
+            progress_bar,
+            dedup,
+            stream_to
         )
 
         # logger.info("DataFrame info:")
@@ -77,7 +84,16 @@ class PandasAdapter(iterative.IterativeAdapter):
 
 
     def iterate(self):
-        return self.df.iterrows()
+        # Rows are yielded as dictionaries, because building a pd.Series for each row
+        # (as `iterrows` does) is a lot slower, and upcasts the values to a common dtype.
+        # Values are converted to Python objects one block of rows at a time,
+        # which is faster than boxing each cell, without copying the whole table.
+        columns = list(self.df.columns)
+        for start in range(0, len(self.df), self.iterate_batch):
+            block = self.df.iloc[start:start + self.iterate_batch]
+            values = zip(*[block.iloc[:, k].tolist() for k in range(len(columns))])
+            for i, row in zip(block.index.tolist(), values):
+                yield i, dict(zip(columns, row))
 
 
     def __len__(self):
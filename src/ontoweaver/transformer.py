@@ -1,5 +1,6 @@
 """ The module that stores all the default transformers and the register functions.
 """
+import os
 import re
 import math
 import sys
@@ -9,6 +10,7 @@ import logging
 import pathlib
 import importlib
 from abc import abstractmethod
+from string import Formatter
 
 import numpy as np
 import pandas as pd
@@ -157,8 +159,7 @@ class map(base.Transformer):
         Raises:
             Warning: If the cell value is invalid.
         """
-        for item in super().__call__(row, i):
-            yield item
+        yield from super().__call__(row, i)
 
 
 class split(base.Transformer):
@@ -172,6 +173,7 @@ class split(base.Transformer):
             super().__init__(raise_errors)
 
         def __call__(self, columns, row, i):
+            separator = self.separator
             for key in columns:
                 if key not in row:
                     self.error(f"Column `{key}` not found in row:\n{row}",
@@ -180,12 +182,10 @@ class split(base.Transformer):
 
                 val = row[key]
                 if isinstance(val, str):
-                    items = val.split(self.separator)
-                    for item in items:
-                        yield item
+                    yield from val.split(separator)
 
                 elif not base.is_not_null(val):
-                    logger.debug(f"Value is null, I'll let my caller skip it.")
+                    logger.debug("Value is null, I'll let my caller skip it.")
                     yield val  # Will be passed by super.__call__
 
                 else:
@@ -252,11 +252,7 @@ class cat(base.Transformer):
             super().__init__(raise_errors)
 
         def __call__(self, columns, row, i):
-            formatted_items = ""
-            for key in columns:
-                formatted_items += str(row[key])
-
-            yield formatted_items
+            yield "".join([str(row[key]) for key in columns])
 
     def __init__(self,
             properties_of,
@@ -295,6 +291,10 @@ class cat(base.Transformer):
             **kwargs
         )
 
+        # Checked once here, rather than for each row.
+        if not self.columns:
+            self.error(f"No column declared for the {type(self).__name__} transformer, did you forgot to add a `columns` keyword?", section=f"{type(self).__name__}.call", exception = exceptions.TransformerInputError)
+
     def __call__(self, row, i):
         """
         Process a row and yield concatenated items as node IDs.
@@ -306,11 +306,7 @@ class cat(base.Transformer):
         Yields:
             str: The concatenated string from the cell values.
         """
-        if not self.columns:
-            self.error(f"No column declared for the {type(self).__name__} transformer, did you forgot to add a `columns` keyword?", section=f"{type(self).__name__}.call", exception = exceptions.TransformerInputError)
-
-        for item in super().__call__(row, i):
-            yield item
+        yield from super().__call__(row, i)
 
 
 class cat_format(base.Transformer):
@@ -321,12 +317,43 @@ class cat_format(base.Transformer):
 
         def __init__(self, raise_errors: bool = True, format_string: str = None):
             self.format_string = format_string
+            self.spec = self.parse_format(format_string)
             super().__init__(raise_errors)
 
+        @staticmethod
+        def parse_format(format_string):
+            """Parse the format string once, into a list of (literal text, column name) pairs.
+
+            Returns:
+                The list of pairs, or None if the format string has fields
+                that are not plain column names (conversions, format specifications,
+                indexing or positional fields), or cannot be parsed.
+                In that case, it is passed to format_map for each row.
+            """
+            if not format_string:
+                return None
+            spec = []
+            try:
+                for literal, name, format_spec, conversion in Formatter().parse(format_string):
+                    if name is not None and (
+                            format_spec or conversion
+                            or not name or name.isdigit()
+                            or "." in name or "[" in name):
+                        return None
+                    spec.append((literal, name))
+            except ValueError:
+                return None
+            return spec
+
         def __call__(self, columns, row, i):
 
             try:
-                formatted_string = self.format_string.format_map(row)
+                if self.spec is None:
+                    formatted_string = self.format_string.format_map(row)
+                else:
+                    formatted_string = "".join([
+                        literal if name is None else literal + str(row[name])
+                        for literal, name in self.spec])
             except KeyError as err:
                 self.error(f"{err}, available keys: {row}",
                     exception = exceptions.TransformerConfigError,
@@ -525,8 +552,7 @@ class nested(base.Transformer):
             self.error(f"No key declared for the `{type(self).__name__}` transformer, did you forgot to add a `keys` keyword?", section="nested.call", exception = exceptions.TransformerInputError)
 
     def __call__(self, row, i):
-        for item in super().__call__(row, i):
-            yield item
+        yield from super().__call__(row, i)
 
 
 class split_nested(base.Transformer):
@@ -686,37 +712,86 @@ class lower_capitalize(map):
             yield val, edge_type, node_type, reverse_edge
 
 
+def _make_translate_mapping_args():
+    """Gather the keywords of a `translate` section that are not arguments of the loading function."""
+    # Possible arguments from the `translate` section.
+    mapping_args = ["translations", "translations_file", "translate_from", "translate_to"]
+    # Possible Python attributes.
+    mapping_args += ["subclass"]
+    # Discard match
+    mapping_args += ["match"]
+    # All possible arguments found in a YAML mapping.
+    for attr in dir(base.MappingParser):
+        if re.match("^k_", attr):
+            mapping_args += getattr(base.MappingParser, attr)
+    return frozenset(mapping_args)
+
+# Computed once, instead of for each translate transformer.
+_translate_mapping_args = _make_translate_mapping_args()
+
+# Marks the cells missing from a translation table (which may translate to None).
+_untranslated = object()
+
+# Translations dictionaries loaded from files, see _translations_key.
+_translations_cache = {}
+
+# Maximum number of translations files kept in _translations_cache.
+translations_cache_size = 16
+
+def clear_translations_cache():
+    """Forget the translations loaded from files by the translate transformers."""
+    _translations_cache.clear()
+
+def _translations_key(translations_file, translate_from, translate_to, load_args):
+    """Identify the translations loaded from a file, including its modification time."""
+    try:
+        mtime = os.path.getmtime(translations_file)
+    except OSError: # e.g. a glob pattern.
+        mtime = None
+    args = tuple(sorted((k, repr(v)) for k, v in load_args.items()))
+    return (os.path.abspath(translations_file), mtime, translate_from, translate_to, args)
+
+
 class translate(base.Transformer):
     """Translate the targeted cell value using a tabular mapping and yield a node with using the translated ID."""
 
     class ValueMaker(make_value.ValueMaker):
+
+        # Number of row indices shown in the warnings about untranslated cells.
+        warn_examples = 10
+
         def __init__(self, translate, translate_from, translate_to, raise_errors: bool = True):
             self.translate = translate
             self.translate_from = translate_from
             self.translate_to = translate_to
+            # Untranslated cells for each column: [count, first row indices].
             self.warn_lines = {}
             super().__init__(raise_errors)
 
         def __call__(self, columns, row, i):
-
+            translated = self.translate.get
             for key in columns:
                 if key not in row:
                     self.error(f"Column '{key}' not found in data", section="translate",
                                exception = exceptions.TransformerDataError)
-                cell = row[key]
-                if cell in self.translate:
-                    yield self.translate[cell]
+                # A single lookup in the translation table.
+                value = translated(row[key], _untranslated)
+                if value is not _untranslated:
+                    yield value
                 else:
-                    msg = f"Some rows does not contain something to be translated"
-                    f" from `{self.translate_from}` to `{self.translate_to}`"
-                    f" at column `{key}`"
-                    self.warn_lines.get(msg, []).append(i)
+                    # The warning is issued once, at the end, see __del__.
+                    warn = self.warn_lines.get(key)
+                    if warn is None:
+                        warn = self.warn_lines[key] = [0, []]
+                    warn[0] += 1
+                    if len(warn[1]) < self.warn_examples:
+                        warn[1].append(str(i))
 
         def __del__(self):  # FIXME make warnings management a common interface
-            if len(self.warn_lines) > 0:
-                logging.warning(f"There was warnings in a translate transformer, on {len(self.warn_lines)} lines:")
-                for w in self.warn_lines:
-                    logging.warning(f"{w}: {', '.join(self.warn_lines[w])}")
+            for key, (count, lines) in self.warn_lines.items():
+                logger.warning(f"Some rows do not contain something to be translated"
+                    f" from `{self.translate_from}` to `{self.translate_to}`"
+                    f" at column `{key}`, on {count} lines: {', '.join(lines)}{', ...' if count > len(lines) else ''}")
 
 
     def __init__(self,
@@ -750,8 +825,6 @@ class translate(base.Transformer):
             kwargs: Additional arguments to pass to a Loader function (e.g. if you want to load TSVs, "sep=TAB", reads the translations_file as tab-separated).
         """
 
-        self.map = map(properties_of, label_maker, branching_properties, columns, output_validator, multi_type_dict, **kwargs)
-
         lpf = loader.LoadPandasFile()
         lpd = loader.LoadPandasDataframe()
         lrf = loader.LoadOWLFile()
@@ -780,57 +853,79 @@ class translate(base.Transformer):
                 # self.translate_from = translate_from
                 # self.translate_to = translate_to
 
-                # Possible arguments from the `translate` section.
-                mapping_args = ["translations", "translations_file", "translate_from", "translate_to"]
-                # Possible Python attributes.
-                mapping_args += ["subclass"]
-                # Discard match
-                mapping_args += ["match"]
-                # All possible arguments found in a YAML mapping.
-                for attr in dir(base.MappingParser):
-                    if re.match("^k_", attr):
-                        mapping_args += getattr(base.MappingParser, attr)
-
                 # Keep only the user-passed arguments that are not in possible YAML keywords.
-                more_args = {k:v for k,v in kwargs.items() if k not in mapping_args}
+                more_args = {k:v for k,v in kwargs.items() if k not in _translate_mapping_args}
                 if "sep" in more_args:
                     if more_args['sep'] == 'TAB': # FIXME why the fuck is this changed somehow?
                         more_args['sep'] = '\t'
 
+                # The loader defaults to the python engine for tabular text files,
+                # because it allows regex separators. The C engine is a lot faster
+                # to read translation tables, and can be used with single-character separators.
+                suffix = pathlib.Path(self.translations_file).suffix
+                default_args = lpf.read_funcs.get(suffix, (None, {}))[1]
+                sep = more_args.get("sep", default_args.get("sep"))
+                if default_args.get("engine") == "python" and "engine" not in more_args \
+                   and isinstance(sep, str) and len(sep) == 1 and "skipfooter" not in more_args:
+                    more_args["engine"] = "c"
+
                 logger.debug(f"\t\t\tAdditional user-passed arguments for the load function: {more_args}")
 
-                self.df = pd.DataFrame()
-                for with_loader in [lpf, lpd, lrf, lrg]:
-                    if with_loader.allows([self.translations_file]):
-                        logger.debug(f"\t\t\tUsing loader: {type(with_loader).__name__}")
-                        try:
-                            self.df = with_loader.load([self.translations_file], **more_args)
-                        except exceptions.InputDataError as err:
-                            logging.error(f"I cannot load the translations_file: `{self.translations_file}`")
-                            raise err
-                        break
-
-                if self.df.empty:
-                    self.error(f"I was not able to load a valid translations_file from: `{self.translations_file}`")
-
-                logger.debug(f"Loaded a DataFrame: {self.df}")
-
-                if self.translate_from not in self.df.columns:
-                    self.error(f"Source column `{self.translate_from}` not found in {type(self).__name__} transformer’s translations file `{self.translations_file}`, available headers: `{','.join(self.df.columns)}`.", section="translate.init", exception = exceptions.TransformerDataError)
-
-                if self.translate_to not in self.df.columns:
-                    self.error(f"Target column `{self.translate_to}` not found in {type(self).__name__} transformer’s translations file `{self.translations_file}`, available headers: `{','.join(self.df.columns)}`.", section="translate.init", exception = exceptions.TransformerDataError)
-
-                self.translate = {}
-                for i,row in self.df.iterrows():
-                    frm = row[self.translate_from]
-                    to = row[self.translate_to]
-                    if frm in self.translate and self.translate[frm] != to:
-                        logger.warning(f"The key `{frm}` already exists in the translation table, and translated to `{self.translate[frm]}`. It now translates to `{to}`. You may want to avoid such duplicates in translation tables.")
-                    if frm and to:
-                        self.translate[frm] = to
-                    else:
-                        logger.warning(f"Cannot translate frm `{self.translate_from}` to `{self.translate_to}`, invalid translations values at row {i} of file `{self.translations_file}`: `{frm}` => `{to}`. I will ignore this translation.")
+                # Several transformers may use the same translations file,
+                # which is thus loaded only once.
+                cache_key = _translations_key(self.translations_file, self.translate_from, self.translate_to, more_args)
+                cached = _translations_cache.get(cache_key)
+                if cached is not None:
+                    logger.debug(f"\t\t\tReuse the translations already loaded from: `{self.translations_file}`")
+                    self.translate = cached
+                else:
+                    df = pd.DataFrame()
+                    for with_loader in [lpf, lpd, lrf, lrg]:
+                        if with_loader.allows([self.translations_file]):
+                            logger.debug(f"\t\t\tUsing loader: {type(with_loader).__name__}")
+                            try:
+                                df = with_loader.load([self.translations_file], **more_args)
+                            except exceptions.InputDataError as err:
+                                logging.error(f"I cannot load the translations_file: `{self.translations_file}`")
+                                raise err
+                            break
+
+                    if df.empty:
+                        self.error(f"I was not able to load a valid translations_file from: `{self.translations_file}`")
+
+                    logger.debug(f"Loaded a DataFrame: {df}")
+
+                    if self.translate_from not in df.columns:
+                        self.error(f"Source column `{self.translate_from}` not found in {type(self).__name__} transformer’s translations file `{self.translations_file}`, available headers: `{','.join(df.columns)}`.", section="translate.init", exception = exceptions.TransformerDataError)
+
+                    if self.translate_to not in df.columns:
+                        self.error(f"Target column `{self.translate_to}` not found in {type(self).__name__} transformer’s translations file `{self.translations_file}`, available headers: `{','.join(df.columns)}`.", section="translate.init", exception = exceptions.TransformerDataError)
+
+                    # The columns are converted to Python objects at once,
+                    # instead of building a Series for each row with `iterrows`.
+                    frms = df[self.translate_from].tolist()
+                    tos = df[self.translate_to].tolist()
+                    valids = (df[self.translate_from].notna() & df[self.translate_to].notna()).tolist()
+
+                    self.translate = {}
+                    invalid_rows = []
+                    for i, frm, to, valid in zip(df.index.tolist(), frms, tos, valids):
+                        if frm in self.translate and self.translate[frm] != to:
+                            logger.warning(f"The key `{frm}` already exists in the translation table, and translated to `{self.translate[frm]}`. It now translates to `{to}`. You may want to avoid such duplicates in translation tables.")
+                        if valid and frm and to:
+                            self.translate[frm] = to
+                        else:
+                            invalid_rows.append(str(i))
+
+                    if invalid_rows:
+                        logger.warning(f"Cannot translate from `{self.translate_from}` to `{self.translate_to}`, invalid translations values at {len(invalid_rows)} rows of file `{self.translations_file}`: {', '.join(invalid_rows)}. I will ignore these translations.")
+
+                    if self.translate:
+                        # Only the dictionary is kept, the table is not needed anymore.
+                        if len(_translations_cache) >= translations_cache_size:
+                            # Forget the oldest loaded file.
+                            del _translations_cache[next(iter(_translations_cache))]
+                        _translations_cache[cache_key] = self.translate
 
         else:
             self.error(f"When using a {type(self).__name__} transformer, you must define either `translations` or `translations_file`.", section="translate.init", exception = exceptions.TransformerInterfaceError)
@@ -857,6 +952,10 @@ class translate(base.Transformer):
             **kwargs
         )
 
+        # Checked once here, rather than for each row.
+        if not self.columns:
+            self.error(f"No column declared for the {type(self).__name__} transformer, did you forgot to add a `columns` keyword?", section="translate", exception = exceptions.TransformerDataError)
+
     def __call__(self, row, i):
         """
         Process a row and yield cell values as node IDs.
@@ -871,11 +970,7 @@ class translate(base.Transformer):
         Raises:
             Warning: If the cell value or the translation is invalid.
         """
-        if not self.columns:
-            self.error(f"No column declared for the {type(self).__name__} transformer, did you forgot to add a `columns` keyword?", section="translate", exception = exceptions.TransformerDataError)
-
-        for item in super().__call__(row, i):
-            yield item
+        yield from super().__call__(row, i)
 
 
 class string(base.Transformer):
@@ -945,8 +1040,7 @@ class string(base.Transformer):
         if not self.value:
             self.error(f"No value passed to the {type(self).__name__} transformer, did you forgot to add a `value` keyword?", section="string.call", exception = exceptions.TransformerInterfaceError)
 
-        for item in super().__call__(row, i):
-            yield item
+        yield from super().__call__(row, i)
 
 
 class replace(base.Transformer):
@@ -961,20 +1055,23 @@ class replace(base.Transformer):
 
             self.forbidden = forbidden
             self.substitute = substitute
+            # The pattern is compiled once, as it is applied on each row.
+            self.forbidden_re = re.compile(forbidden)
+            logger.debug(
+                f"Setting forbidden characters: {self.forbidden} for `replace` transformer, with substitute character: `{self.substitute}`.")
             super().__init__(raise_errors)
 
         def __call__(self, columns, row, i):
+            substitute = self.substitute
+            sub = self.forbidden_re.sub
             for key in columns:
 
                 if not base.is_not_null(row[key]):
                     yield row[key]
                 else: 
-                    logger.debug(
-                        f"Setting forbidden characters: {self.forbidden} for `replace` transformer, with substitute character: `{self.substitute}`.")
-                    formatted = re.sub(self.forbidden, self.substitute, row[key])
-
-                    strip_formatted = formatted.strip(self.substitute)
-                    logger.debug(f"Formatted value: {strip_formatted}")
+                    strip_formatted = sub(substitute, row[key]).strip(substitute)
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(f"Formatted value: {strip_formatted}")
                     yield strip_formatted
 
     def __init__(self,
@@ -46,6 +46,21 @@ class Validator(errormanager.ErrorManager):
         self.messages[msg] = err
 
 
+    def merge_messages(self, messages):
+        """Add the counts of validation error messages recorded by another validator.
+
+        This is used to gather the messages recorded by the copies
+        of this validator in the worker processes of a parallel mapping.
+
+        Args:
+            messages: The `messages` dictionary of the other validator.
+        """
+        for msg, other in messages.items():
+            err = self.messages.get(msg, {"count": 0, "section": other["section"]})
+            err["count"] += other["count"]
+            self.messages[msg] = err
+
+
     def __call__(self, df, section = None):
         """
         Validate the data frame against the schema.
@@ -89,6 +104,15 @@ class Validator(errormanager.ErrorManager):
             return True
 
 
+    def scalar_check(self):
+        """Return the function validating a single value.
+
+        Used by base.Transformer, which calls it for each value it produces.
+        Validators working on scalars directly return their own call operator.
+        """
+        return self.__call__
+
+
     def make_raise_warnings(self, rules = None):
         if not rules:
             rules = self.validation_rules.columns
@@ -158,6 +182,9 @@ class OutputValidator(Validator):
     The schema contains some general rules for the output data frame expected by default. The user can add additional rules
     to the schema for each transformer type used on each column. The class uses the Pandera package to validate the data frame."""
 
+    # Maximum number of distinct valid values remembered by `validate_scalar`.
+    valid_cache_size = 100_000
+
     def __init__(self,
                 validation_rules = default_validation_rules,
             raise_errors = True):
@@ -168,6 +195,9 @@ class OutputValidator(Validator):
             validation_rules: The schema used for validation.
         """
         super().__init__(validation_rules, raise_errors)
+        self.scalar_rules = self.make_scalar_rules()
+        # Values already found valid by validate_scalar.
+        self.valid_values = set()
 
 
     def __call__(self, df):
@@ -183,6 +213,80 @@ class OutputValidator(Validator):
         return super().__call__(df, section = self.__class__.__name__)
 
 
+    def make_scalar_rules(self):
+        """Build a Series-level schema from the rules on the `cell_value` column.
+
+        Returns:
+            pa.SeriesSchema: the schema checking a single cell value,
+            or None if the rules declare schema-level (multi-column) checks,
+            in which case the whole DataFrame must be validated.
+        """
+        if not self.validation_rules:
+            return None
+
+        if self.validation_rules.checks or list(self.validation_rules.columns.keys()) != ["cell_value"]:
+            return None
+
+        column = self.validation_rules.columns["cell_value"]
+        return pa.SeriesSchema(
+            column.dtype,
+            checks = column.checks,
+            nullable = column.nullable,
+            unique = column.unique,
+            coerce = column.coerce,
+            name = "cell_value",
+        )
+
+
+    def scalar_check(self):
+        """Return validate_scalar, as this validator works on DataFrames."""
+        return self.validate_scalar
+
+
+    def validate_scalar(self, val):
+        """
+        Validate a single cell value against the schema.
+
+        This avoids building a one-row DataFrame for each extracted value,
+        which is costly when processing large datasets.
+
+        Args:
+            val: The value to validate.
+
+        Returns:
+            bool: True if the value is valid, False otherwise.
+            May raise a pa.errors.SchemaError (e.g. on null values),
+            which is catched in base.Transformer.validate.
+        """
+        if self.scalar_rules is None:
+            return self(pd.DataFrame([val], columns=["cell_value"]))
+
+        # Tables often repeat the same values, which are validated only once.
+        # Only the valid values are remembered, so that errors are still
+        # reported (and counted) for each invalid value.
+        cacheable = type(val) is str
+        if cacheable and val in self.valid_values:
+            return True
+
+        series = pd.Series([val], name = "cell_value")
+        dtype = str(self.scalar_rules.dtype)
+        if dtype in self.dtypes:
+            series = series.astype(self.dtypes[dtype])
+
+        with warnings.catch_warnings(record = True) as caught:
+            warnings.simplefilter("always")
+            self.scalar_rules.validate(series)
+            for warn in caught:
+                self.error(str(warn.message), section = self.__class__.__name__)
+
+            if not caught and cacheable:
+                if len(self.valid_values) >= self.valid_cache_size:
+                    self.valid_values.clear()
+                self.valid_values.add(val)
+
+            return not caught
+
+
     def update_rules(self, new_rules):
         """Update the validation schema with additional rules.
 
@@ -202,6 +306,8 @@ class OutputValidator(Validator):
 
         # Update the validation rules
         self.validation_rules = pa.DataFrameSchema(merged_rules)
+        self.scalar_rules = self.make_scalar_rules()
+        self.valid_values.clear()
 
 
 class SimpleOutputValidator(Validator):
@@ -218,8 +324,18 @@ class SimpleOutputValidator(Validator):
 
 
     def __call__(self, val):
-        if pd.api.types.is_numeric_dtype(type(val)):
-            if math.isnan(val) or val == float("nan"):
+        # Fast paths for the most common cell types,
+        # avoiding the costly dtype inference of Pandas.
+        cls = type(val)
+        if cls is str:
+            return val != "" and val.lower() != "nan"
+        elif cls is float:
+            return not math.isnan(val)
+        elif cls is int or cls is bool:
+            return True
+
+        if pd.api.types.is_numeric_dtype(cls):
+            if math.isnan(val):
                 return False
 
         elif str(val).lower() == "nan" or val == "":
@@ -0,0 +1,79 @@
+import ontoweaver
+
+def test_dedup():
+
+    class Source(ontoweaver.base.Node):
+        pass
+    class Target(ontoweaver.base.Node):
+        pass
+    class Link(ontoweaver.base.Edge):
+        @staticmethod
+        def source_type():
+            return Source
+        @staticmethod
+        def target_type():
+            return Target
+
+    class Dummy(ontoweaver.base.Adapter):
+        def run(self):
+            yield [], []
+
+    nodes = [Source("1", {"p1":"z"}), Source("1", {"p1":"z"}), Source("1", {"p1":"y"}), Target("2")]
+    edges = [Link("0", "1", "2"), Link("0", "1", "2")]
+
+    adapter = Dummy()
+    adapter.nodes_append(nodes)
+    adapter.edges_append(edges)
+    assert(len(list(adapter.nodes)) == 4)
+    assert(len(list(adapter.edges)) == 2)
+
+    adapter = Dummy(dedup = True)
+    adapter.nodes_append(nodes)
+    adapter.nodes_append(nodes[0])
+    adapter.nodes_append(nodes[3])
+    adapter.edges_append(edges)
+    adapter.edges_append(edges[0])
+    assert(len(list(adapter.nodes)) == 3)
+    assert(len(list(adapter.edges)) == 1)
+
+
+def test_extract_dedup(tmp_path):
+    import yaml
+    import pandas as pd
+
+    mapping = yaml.safe_load("""
+row:
+    map:
+        column: name
+        to_subject: person
+transformers:
+    - map:
+        column: friend
+        to_object: person
+        via_relation: knows
+""")
+    # The same rows appear in both chunks.
+    df = pd.DataFrame({"name": ["a", "b", "a", "b"],
+                       "friend": ["b", "a", "b", "a"]})
+
+    nodes, edges = ontoweaver.extract_table(df, mapping, affix = "none")
+    assert(len(nodes) == 8)
+    assert(len(edges) == 4)
+
+    nodes, edges = ontoweaver.extract_table(df, mapping, affix = "none", dedup = True)
+    assert(sorted(n.id for n in nodes) == ["a", "b"])
+    assert(sorted((e.id_source, e.id_target) for e in edges) == [("a", "b"), ("b", "a")])
+
+    csv = tmp_path / "data.csv"
+    df.to_csv(csv, index = False)
+    nodes, edges = ontoweaver.extract_table_chunked(str(csv), mapping, chunksize = 2, affix = "none", dedup = True)
+    assert(sorted(n.id for n in nodes) == ["a", "b"])
+    assert(len(edges) == 2)
+
+
+if __name__ == "__main__":
+    import tempfile
+    import pathlib
+    test_dedup()
+    with tempfile.TemporaryDirectory() as d:
+        test_extract_dedup(pathlib.Path(d))
@@ -0,0 +1,46 @@
+def test_extract_chunked():
+    from . import testing_functions
+    import logging
+    import ontoweaver
+
+    directory_name = "simplest"
+
+    expected_nodes = [
+        ('0', 'variant', {}),
+        ('1', 'variant', {}),
+        ('2', 'variant', {}),
+        ('A', 'patient', {}),
+        ('B', 'patient', {}),
+        ('C', 'patient', {}),
+    ]
+
+    expected_edges = [
+        ('', '0', 'A', 'patient_has_variant', {}),
+        ('', '1', 'B', 'patient_has_variant', {}),
+        ('', '2', 'C', 'patient_has_variant', {}),
+    ]
+
+    # Three rows read two by two.
+    nodes, edges = ontoweaver.extract_table_chunked(
+        f"tests/{directory_name}/data.csv",
+        f"tests/{directory_name}/mapping.yaml",
+        chunksize = 2,
+        affix = "none"
+    )
+
+    logging.debug(f"NODES: {nodes}")
+    logging.debug(f"EDGES: {edges}")
+    bc_nodes = [n.as_tuple() for n in nodes]
+    bc_edges = [e.as_tuple() for e in edges]
+    fnodes, fedges = ontoweaver.fusion.reconciliate(
+        bc_nodes,
+        bc_edges,
+        reconciliate_sep=","
+    )
+
+    testing_functions.assert_equals(fnodes, expected_nodes)
+    testing_functions.assert_equals(fedges, expected_edges)
+
+
+if __name__ == "__main__":
+    test_extract_chunked()
@@ -0,0 +1,48 @@
+import logging
+
+
+class _Records(logging.Handler):
+    def __init__(self):
+        super().__init__(logging.WARNING)
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+
+def test_make_id_brackets_warning():
+    import yaml
+    import pandas as pd
+    import ontoweaver
+
+    mapping = yaml.safe_load("""
+row:
+    map:
+        column: name
+        to_subject: person
+transformers:
+    - map:
+        column: friend
+        to_object: person
+        via_relation: knows
+""")
+    df = pd.DataFrame({"name": ["[a]", "b"], "friend": ["b", "[a]"]})
+
+    # The formatting of IDs is cached for all the adapters,
+    # but each of them should warn about the same suspicious ID.
+    logger = logging.getLogger("ontoweaver")
+    for _ in range(2):
+        mapper = ontoweaver.mapping.YamlParser(mapping, raise_errors = False)()
+        adapter = ontoweaver.tabular.PandasAdapter(df, *mapper, raise_errors = False)
+        records = _Records()
+        logger.addHandler(records)
+        try:
+            list(adapter())
+        finally:
+            logger.removeHandler(records)
+        assert(any("contains brackets" in msg for msg in records.messages))
+        assert(sorted(set(n[0] for n in adapter.nodes)) == ["[a]:person", "b:person"])
+
+
+if __name__ == "__main__":
+    test_make_id_brackets_warning()
@@ -33,5 +33,22 @@ def test_output_validation():
     testing_functions.assert_equals(fedges, expected_edges)
 
 
+def test_output_validation_repeated_values():
+    import ontoweaver
+
+    validator = ontoweaver.validate.OutputValidator(raise_errors=False)
+
+    assert(validator.validate_scalar("A"))
+    assert("A" in validator.valid_values)
+    assert(validator.validate_scalar("A"))
+
+    # Invalid values are validated (and reported) each time.
+    assert(not validator.validate_scalar(""))
+    assert(not validator.validate_scalar(""))
+    assert("" not in validator.valid_values)
+    assert(sum(m["count"] for m in validator.messages.values()) == 2)
+
+
 if __name__ == "__main__":
     test_output_validation()
+    test_output_validation_repeated_values()
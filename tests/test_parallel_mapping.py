@@ -744,5 +744,122 @@ def DISABLED_test_oncokb():
 
     assert assert_edge_set == f_edge_set, "Edges are not equal."
 
+
+def test_parallel_as_sequential():
+    from . import testing_functions
+    import ontoweaver
+
+    directory_name = "oncokb"
+    data_mapping = {f"tests/{directory_name}/data.csv": f"tests/{directory_name}/mapping.yaml"}
+
+    seq_nodes, seq_edges = ontoweaver.extract(data_mapping, affix="suffix", parallel_mapping=0, validate_output=True, raise_errors=False)
+    par_nodes, par_edges = ontoweaver.extract(data_mapping, affix="suffix", parallel_mapping=4, validate_output=True, raise_errors=False)
+
+    assert par_nodes, "There is no node"
+    assert par_edges, "There is no edge"
+
+    assert testing_functions.convert_to_set(ontoweaver.ow2bc(seq_nodes)) == testing_functions.convert_to_set(ontoweaver.ow2bc(par_nodes)), "Nodes are not equal."
+    assert testing_functions.convert_to_set(ontoweaver.ow2bc(seq_edges)) == testing_functions.convert_to_set(ontoweaver.ow2bc(par_edges)), "Edges are not equal."
+
+
+def _tiny_mapping():
+    import yaml
+    return yaml.safe_load("""
+row:
+    map:
+        column: name
+        to_subject: person
+transformers:
+    - map:
+        column: friend
+        to_object: person
+        via_relation: knows
+""")
+
+
+def _skipping_adapter():
+    import ontoweaver
+
+    class SkippingAdapter(ontoweaver.tabular.PandasAdapter):
+        """Does not make any ID for the subjects named "skip"."""
+        def make_id(self, entry_type, entry_name):
+            if entry_name == "skip":
+                return None
+            return super().make_id(entry_type, entry_name)
+
+    return SkippingAdapter
+
+
+def test_parallel_empty_input():
+    import pandas as pd
+    import ontoweaver
+
+    df = pd.DataFrame({"name": [], "friend": []})
+    for parallel in (0, 2):
+        mapper = ontoweaver.mapping.YamlParser(_tiny_mapping(), raise_errors = False)()
+        adapter = ontoweaver.tabular.PandasAdapter(df, *mapper, parallel_mapping = parallel, raise_errors = False)
+        assert(list(adapter()) == [])
+        assert(adapter.nb_nodes() == 0)
+
+
+def test_parallel_non_viable_rows():
+    import pandas as pd
+    import ontoweaver
+
+    # A non-default index, to check that rows are reported by their index label.
+    df = pd.DataFrame({"name": ["a", "skip", "c", "skip", "e"],
+                       "friend": ["b", "c", "a", "e", "a"]},
+                      index = [10, 20, 30, 40, 50])
+
+    results = {}
+    for parallel in (0, 2):
+        mapper = ontoweaver.mapping.YamlParser(_tiny_mapping(), raise_errors = False)()
+        adapter = _skipping_adapter()(df, *mapper, parallel_mapping = parallel, raise_errors = False)
+        # Several batches for each worker.
+        adapter.parallel_batch = 1
+        list(adapter())
+        results[parallel] = (set(adapter.non_viable_rows), sorted(n[0] for n in adapter.nodes))
+        # Do not warn about the skipped rows.
+        adapter.non_viable_rows.clear()
+
+    assert(results[0][0] == {20, 40})
+    assert(results[0] == results[2])
+
+
+def test_parallel_validation_messages():
+    import pandas as pd
+    import ontoweaver
+
+    class Rejecting(ontoweaver.validate.Validator):
+        """Records an error for each "c" value."""
+        def scalar_check(self):
+            def check(val):
+                if val == "c":
+                    self.error(f"rejected {val}")
+                    return False
+                return True
+            return check
+
+    df = pd.DataFrame({"name": ["a", "b", "c", "d", "e"],
+                       "friend": ["c", "c", "a", "c", "b"]})
+
+    messages = {}
+    for parallel in (0, 2):
+        mapper = ontoweaver.mapping.YamlParser(_tiny_mapping(), raise_errors = False)()
+        adapter = ontoweaver.tabular.PandasAdapter(df, *mapper, parallel_mapping = parallel, raise_errors = False)
+        adapter.parallel_batch = 1
+        for t in adapter.transformers:
+            t.output_validator = Rejecting(raise_errors = False)
+        list(adapter())
+        messages[parallel] = [t.output_validator.messages for t in adapter.transformers]
+
+    assert(messages[0] == [{"rejected c": {"count": 3, "section": None}}])
+    assert(messages[0] == messages[2])
+
+
 if __name__ == "__main__":
     test_oncokb()
+    test_parallel_as_sequential()
+    test_parallel_empty_input()
+    test_parallel_non_viable_rows()
+    test_parallel_validation_messages()
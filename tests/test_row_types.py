@@ -0,0 +1,38 @@
+def _mapping():
+    import yaml
+    return yaml.safe_load("""
+row:
+    map:
+        column: count
+        to_subject: sample
+transformers:
+    - map:
+        column: ratio
+        to_object: measure
+        via_relation: measured
+""")
+
+
+def test_mixed_int_float_ids():
+    import pandas as pd
+    import ontoweaver
+
+    # Under iterrows, each row was a pd.Series of a common dtype,
+    # so that the integers were upcast to floats and got IDs like "1.0".
+    # Rows are now dictionaries, and keep the dtype of their column.
+    df = pd.DataFrame({"count": [1, 2, 3],
+                       "ratio": [1.5, 2.0, 0.25]})
+    assert(df["count"].dtype.kind == "i")
+
+    mapper = ontoweaver.mapping.YamlParser(_mapping(), raise_errors = False)()
+    adapter = ontoweaver.tabular.PandasAdapter(df, *mapper, type_affix = ontoweaver.base.TypeAffixes.none, raise_errors = False)
+    list(adapter())
+
+    nodes = sorted(n[0] for n in adapter.nodes)
+    edges = sorted((e[1], e[2]) for e in adapter.edges)
+    assert(nodes == ["0.25", "1", "1.5", "2", "2.0", "3"])
+    assert(edges == [("1", "1.5"), ("2", "2.0"), ("3", "0.25")])
+
+
+if __name__ == "__main__":
+    test_mixed_int_float_ids()
@@ -44,5 +44,47 @@ def test_serialize():
     assert(str(l) == "Link:0Link")
 
 
+    serializer = ontoweaver.serialize.All()
+
+    s = Source.from_tuple(node, serializer)
+    l =   Link.from_tuple(edge, serializer)
+
+    # The serialization and its hash are cached, but setters should reset them.
+    assert(str(s) == "Source:1Source{'p1': 'z'}")
+    assert(hash(s) == hash("Source:1Source{'p1': 'z'}"))
+    s.properties = {"p2": "y"}
+    assert(hash(s) == hash("Source:1Source{'p2': 'y'}"))
+    assert(str(s) == "Source:1Source{'p2': 'y'}")
+
+    assert(str(l) == "Source:1Target:2Link:0Link{}")
+    l.id_target = "Target:3"
+    assert(hash(l) == hash("Source:1Target:3Link:0Link{}"))
+    assert(str(l) == "Source:1Target:3Link:0Link{}")
+
+    # Changing the serializer resets them too.
+    s.serializer = ontoweaver.serialize.ID()
+    assert(str(s) == "Source:1")
+    assert(hash(s) == hash("Source:1"))
+
+    # Elements are not equal to their serialization.
+    assert(l != "Source:1Target:3Link:0Link{}")
+    assert(l == Link.from_tuple(l.as_tuple(), serializer))
+
+
+def test_declared_slots():
+    declare = ontoweaver.base.Declare()
+    Source = declare.make_node_class("SlottedSource", {"p1": "p1"})
+    Target = declare.make_node_class("SlottedTarget")
+    Link = declare.make_edge_class("SlottedLink", Source, Target)
+
+    # Declared classes do not add a __dict__ to the slotted base classes.
+    s = Source(id = "Source:1", properties = {"p1": "z"})
+    l = Link(id = "Link:0", id_source = "Source:1", id_target = "Target:2")
+    assert(not hasattr(s, "__dict__"))
+    assert(not hasattr(l, "__dict__"))
+    assert(s.as_tuple() == ("Source:1", "SlottedSource", {"p1": "z"}))
+
+
 if __name__ == "__main__":
     test_serialize()
+    test_declared_slots()
@@ -0,0 +1,99 @@
+import ontoweaver
+
+def test_stream_to(tmp_path):
+
+    class Source(ontoweaver.base.Node):
+        pass
+    class Target(ontoweaver.base.Node):
+        pass
+    class Link(ontoweaver.base.Edge):
+        @staticmethod
+        def source_type():
+            return Source
+        @staticmethod
+        def target_type():
+            return Target
+
+    class Dummy(ontoweaver.base.Adapter):
+        def run(self):
+            yield [], []
+
+    # Properties of various types, which must be read back unchanged.
+    nodes = [Source(str(i), {"p1": str(i), "p2": i, "p3": (i, float(i)), "p4": {i: {"x"}}}) for i in range(7)]
+    edges = [Link(str(i), str(i), str(i+1)) for i in range(5)]
+
+    adapter = Dummy(stream_to = str(tmp_path), stream_batch = 3)
+    adapter.nodes_append(nodes)
+    adapter.edges_append(edges)
+
+    # Two files of nodes and one of edges have been written, the remaining ones are in memory.
+    assert(len(list(tmp_path.rglob("*.parquet"))) == 3)
+    assert(adapter.nb_nodes() == 7)
+    assert(adapter.nb_edges() == 5)
+    assert(list(adapter.nodes) == [n.as_tuple() for n in nodes])
+    assert(list(adapter.edges) == [e.as_tuple() for e in edges])
+
+    # Another adapter streaming to the same directory does not mix its files.
+    other = Dummy(stream_to = str(tmp_path), stream_batch = 3)
+    other.nodes_append(nodes[:3])
+    assert(len(list(tmp_path.rglob("*.parquet"))) == 4)
+    assert(list(adapter.nodes) == [n.as_tuple() for n in nodes])
+    assert(list(other.nodes) == [n.as_tuple() for n in nodes[:3]])
+
+    adapter.clear_elements()
+    other.clear_elements()
+    assert(len(list(tmp_path.rglob("*.parquet"))) == 0)
+    assert(list(adapter.nodes) == [])
+
+
+def test_stream_to_failed_run(tmp_path):
+    import yaml
+    import pandas as pd
+
+    class Failing(ontoweaver.tabular.PandasAdapter):
+        """Fails on the subjects named "boom"."""
+        def make_id(self, entry_type, entry_name):
+            if entry_name == "boom":
+                raise RuntimeError("Failed mapping")
+            return super().make_id(entry_type, entry_name)
+
+    mapping = yaml.safe_load("""
+row:
+    map:
+        column: name
+        to_subject: person
+transformers:
+    - map:
+        column: friend
+        to_object: person
+        via_relation: knows
+""")
+    df = pd.DataFrame({"name": ["a", "b", "c", "boom"],
+                       "friend": ["b", "c", "a", "a"]})
+    mapper = ontoweaver.mapping.YamlParser(mapping, raise_errors = False)()
+    adapter = Failing(df, *mapper, raise_errors = False, stream_to = str(tmp_path))
+    adapter.stream_batch = 2
+    written = 0
+    try:
+        for _ in adapter():
+            written = max(written, len(list(tmp_path.rglob("*.parquet"))))
+        assert(False)
+    except RuntimeError:
+        pass
+    assert(written > 0)
+
+    # The files of the failed run have been removed.
+    assert(len(list(tmp_path.rglob("*.parquet"))) == 0)
+
+    # And so is the adapter's directory, once it is collected.
+    del adapter
+    assert(list(tmp_path.iterdir()) == [])
+
+
+if __name__ == "__main__":
+    import tempfile
+    import pathlib
+    with tempfile.TemporaryDirectory() as d:
+        test_stream_to(pathlib.Path(d))
+    with tempfile.TemporaryDirectory() as d:
+        test_stream_to_failed_run(pathlib.Path(d))
@@ -4,6 +4,11 @@ import pandas as pd
 
 import ontoweaver
 
+
+def teardown_function():
+    ontoweaver.transformer.clear_translations_cache()
+
+
 def test_translate_file():
 
     directory_name = "simplest"
@@ -42,5 +47,38 @@ def test_translate_file():
         assert(n.as_tuple()[0].isnumeric() or n.as_tuple()[0].islower())
 
 
+def test_translate_file_loaded_once():
+
+    kwargs = dict(
+        columns = ["patient"],
+        translations_file = "tests/translate/translations.tsv",
+        translate_from = "From",
+        translate_to = "To",
+        sep = "TAB",
+    )
+    first = ontoweaver.transformer.translate({}, **kwargs)
+    second = ontoweaver.transformer.translate({}, **kwargs)
+
+    assert(first.translate)
+    assert(first.translate is second.translate)
+
+    other = ontoweaver.transformer.translate({}, **dict(kwargs, translate_from = "To", translate_to = "From"))
+    assert(other.translate is not first.translate)
+
+    # The cache is bounded.
+    size = ontoweaver.transformer.translations_cache_size
+    ontoweaver.transformer.translations_cache_size = 1
+    try:
+        ontoweaver.transformer.clear_translations_cache()
+        ontoweaver.transformer.translate({}, **kwargs)
+        ontoweaver.transformer.translate({}, **dict(kwargs, translate_from = "To", translate_to = "From"))
+        assert(len(ontoweaver.transformer._translations_cache) == 1)
+        third = ontoweaver.transformer.translate({}, **kwargs)
+        assert(third.translate is not first.translate)
+    finally:
+        ontoweaver.transformer.translations_cache_size = size
+
+
 if __name__ == "__main__":
     test_translate_file()
+    test_translate_file_loaded_once()
@@ -0,0 +1,62 @@
+import math
+
+import numpy
+import pandas as pd
+
+import ontoweaver
+
+
+def test_adapter_valid():
+    # valid does not use the adapter's state.
+    valid = ontoweaver.iterative.IterativeAdapter.valid
+
+    # Expected results are the ones of the checks without the type fast paths.
+    cases = [
+        (1, True),
+        (0, True),
+        (True, True),
+        (False, True),
+        (1.5, True),
+        (0.0, True),
+        (float("nan"), False),
+        (math.nan, False),
+        (None, True),
+        ("nan", False),
+        ("NaN", True),
+        ("", True),
+        ("text", True),
+        (numpy.int64(1), True),
+        (numpy.float64(1.5), True),
+        (numpy.float64("nan"), False),
+        (pd.NA, True),
+    ]
+    for val, expected in cases:
+        assert(valid(None, val) == expected)
+
+
+def test_simple_output_validator():
+    validator = ontoweaver.validate.SimpleOutputValidator()
+
+    cases = [
+        (1, True),
+        (0, True),
+        (True, True),
+        (False, True),
+        (1.5, True),
+        (float("nan"), False),
+        (None, True),
+        ("nan", False),
+        ("NaN", False),
+        ("", False),
+        ("text", True),
+        (numpy.int64(1), True),
+        (numpy.float64(1.5), True),
+        (numpy.float64("nan"), False),
+    ]
+    for val, expected in cases:
+        assert(validator(val) == expected)
+
+
+if __name__ == "__main__":
+    test_adapter_valid()
+    test_simple_output_validator()